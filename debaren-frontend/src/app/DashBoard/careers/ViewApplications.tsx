@@ -207,7 +207,7 @@ export default function ViewApplications() {
                     </select>
                   </div>
                   <button
-                    onClick={() => downloadResume(app.resume, `${app.full_name}_resume.pdf`)}
+                    onClick={() => app.resume_url && downloadResume(app.resume_url, `${app.full_name}_resume.pdf`)}
                     className="inline-flex items-center px-3 py-1.5 text-sm text-white bg-gray-800 hover:bg-gray-700 rounded shadow"
                   >
                     Download Resume
@@ -1,11 +1,15 @@
 "use client";
+import { useState } from "react";
 import { useGetPopupVenuesQuery } from "@/services/debarenApi";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import Image from "next/image";
 import Link from "next/link";
 import ShimmerCard from "@/components/ShimmerCard";
 
 export default function PopupVenuesPage() {
-  const { data, isLoading, error } = useGetPopupVenuesQuery();
+  const [cursor, setCursor] = useState<string | null>(null);
+  const { data, isLoading, isFetching, error } = useGetPopupVenuesQuery(cursor);
+  const items = data?.results ?? [];
 
   return (
     <div className="max-w-7xl mx-auto px-4 py-10">
@@ -27,9 +31,9 @@ export default function PopupVenuesPage() {
       )}
 
       {/* Venues Grid */}
-      {!isLoading && !error && Array.isArray(data) && (
+      {!isLoading && !error && data && (
         <div className="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 gap-8">
-          {data.map((item) => (
+          {items.map((item) => (
             <Link
               href={`/popup-venues/${item.id}`}
               key={item.id}
@@ -74,6 +78,8 @@ export default function PopupVenuesPage() {
           ))}
         </div>
       )}
+
+      <LoadMoreButton next={data?.next} loading={isFetching} onLoad={setCursor} />
     </div>
   );
 }
@@ -1,11 +1,15 @@
 "use client";
+import { useState } from "react";
 import { useGetSchoolProgramsQuery } from "@/services/debarenApi";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import SchoolShimmerCard from "@/components/SchoolShimmerCard";
 import Image from "next/image";
 import { FaGraduationCap } from "react-icons/fa";
 
 export default function SchoolPage() {
-  const { data, isLoading, error } = useGetSchoolProgramsQuery();
+  const [cursor, setCursor] = useState<string | null>(null);
+  const { data, isLoading, isFetching, error } = useGetSchoolProgramsQuery(cursor);
+  const programs = data?.results ?? [];
 
   return (
     <div className="max-w-5xl mx-auto px-4 py-10">
@@ -26,9 +30,9 @@ export default function SchoolPage() {
         </div>
       )}
 
-      {!isLoading && !error && Array.isArray(data) && (
+      {!isLoading && !error && data && (
         <div className="grid grid-cols-1 md:grid-cols-2 gap-8">
-          {data.map((program) => (
+          {programs.map((program) => (
             <div
               key={program.id}
               className="bg-white rounded-2xl shadow-lg hover:shadow-2xl hover:-translate-y-1 transition-all duration-300 border border-yellow-50 flex flex-col md:flex-row"
@@ -58,6 +62,8 @@ export default function SchoolPage() {
           ))}
         </div>
       )}
+
+      <LoadMoreButton next={data?.next} loading={isFetching} onLoad={setCursor} />
     </div>
   );
 }
@@ -1,6 +1,6 @@
 "use client";
 import { useParams } from "next/navigation";
-import { useGetVenuesQuery, useBookVenueMutation } from "@/services/debarenApi";
+import { useGetVenueQuery, useBookVenueMutation } from "@/services/debarenApi";
 import { useState } from "react";
 import Image from "next/image";
 import { FaMapMarkerAlt, FaGlobe, FaPhone, FaEnvelope, FaStar, FaHeart, FaRegHeart } from "react-icons/fa";
@@ -9,8 +9,7 @@ import type { BookingForm } from "@/types/debaren";
 
 export default function VenueDetailPage() {
   const { id } = useParams();
-  const { data: venues } = useGetVenuesQuery();
-  const venue = venues?.find((v) => String(v.id) === String(id));
+  const { data: venue } = useGetVenueQuery(String(id));
   const [showBooking, setShowBooking] = useState(false);
   const [wishlist, setWishlist] = useState(false);
 
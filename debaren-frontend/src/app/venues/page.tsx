@@ -1,36 +1,31 @@
 "use client";
 
 import { useGetVenuesQuery } from "@/services/debarenApi";
-import { useState, useMemo } from "react";
+import { useEffect, useState } from "react";
 import { Transition } from "@headlessui/react";
 import Image from "next/image";
 import Link from "next/link";
 import { MapPin, Users, Star, Tag, Search } from "lucide-react";
+import LoadMoreButton from "@/components/LoadMoreButton";
 
-const ITEMS_PER_PAGE = 9;
+const SEARCH_DELAY_MS = 300;
 
 export default function VenuesPage() {
-  const { data: venues = [], isLoading, error } = useGetVenuesQuery();
   const [searchQuery, setSearchQuery] = useState("");
-  const [currentPage, setCurrentPage] = useState(1);
+  const [query, setQuery] = useState("");
+  const [cursor, setCursor] = useState<string | null>(null);
 
-  const filteredVenues = useMemo(() => {
-    const query = searchQuery.toLowerCase();
-    return venues.filter(
-      (venue) =>
-        venue.name.toLowerCase().includes(query) ||
-        venue.city?.toLowerCase().includes(query) ||
-        venue.region?.toLowerCase().includes(query) ||
-        venue.country?.toLowerCase().includes(query)
-    );
-  }, [venues, searchQuery]);
+  // Search runs on the server (?q=), so wait for a pause in typing.
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setQuery(searchQuery.trim());
+      setCursor(null);
+    }, SEARCH_DELAY_MS);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
 
-  const paginatedVenues = useMemo(() => {
-    const start = (currentPage - 1) * ITEMS_PER_PAGE;
-    return filteredVenues.slice(start, start + ITEMS_PER_PAGE);
-  }, [filteredVenues, currentPage]);
-
-  const totalPages = Math.ceil(filteredVenues.length / ITEMS_PER_PAGE);
+  const { data, isLoading, isFetching, error } = useGetVenuesQuery({ q: query, cursor });
+  const venues = data?.results ?? [];
 
   return (
     <div className="max-w-7xl mx-auto px-4 py-12">
@@ -43,12 +38,9 @@ export default function VenuesPage() {
         <Search className="absolute left-4 top-1/2 transform -translate-y-1/2 text-gray-400" />
         <input
           type="search"
-          placeholder="Search venues, cities, countries..."
+          placeholder="Search venues..."
           value={searchQuery}
-          onChange={(e) => {
-            setSearchQuery(e.target.value);
-            setCurrentPage(1);
-          }}
+          onChange={(e) => setSearchQuery(e.target.value)}
           className="w-full rounded-full border py-3 pl-12 pr-4 shadow-sm focus:outline-none focus:ring-2 focus:ring-yellow-400"
         />
       </div>
@@ -77,7 +69,7 @@ export default function VenuesPage() {
         enterTo="opacity-100"
       >
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
-          {paginatedVenues.map((venue) => (
+          {venues.map((venue) => (
             <Link
               key={venue.id}
               href={`/venues/${venue.id}`}
@@ -144,28 +136,11 @@ export default function VenuesPage() {
           ))}
         </div>
 
-        {/* Pagination */}
-        {totalPages > 1 && (
-          <div className="mt-10 flex justify-center gap-2">
-            {Array.from({ length: totalPages }, (_, i) => (
-              <button
-                key={i}
-                className={`px-4 py-2 rounded-full transition ${
-                  currentPage === i + 1
-                    ? "bg-yellow-600 text-white"
-                    : "bg-gray-200 text-gray-700 hover:bg-yellow-100"
-                }`}
-                onClick={() => setCurrentPage(i + 1)}
-              >
-                {i + 1}
-              </button>
-            ))}
-          </div>
-        )}
+        <LoadMoreButton next={data?.next} loading={isFetching} onLoad={setCursor} />
       </Transition>
 
       {/* No Results Found */}
-      {!isLoading && !error && filteredVenues.length === 0 && (
+      {!isLoading && !isFetching && !error && venues.length === 0 && (
         <div className="text-center text-gray-500 py-10">
   No venues found for &quot;{searchQuery}&quot;.
 </div>
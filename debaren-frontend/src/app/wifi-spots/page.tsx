@@ -1,10 +1,14 @@
 "use client";
+import { useState } from "react";
 import { useGetWifiSpotsQuery } from "@/services/debarenApi";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import { FaWifi } from "react-icons/fa";
 import WifiShimmerCard from "@/components/WifiShimmerCard";
 
 export default function WifiSpotsPage() {
-  const { data, isLoading, error } = useGetWifiSpotsQuery();
+  const [cursor, setCursor] = useState<string | null>(null);
+  const { data, isLoading, isFetching, error } = useGetWifiSpotsQuery(cursor);
+  const spots = data?.results ?? [];
 
   return (
     <div className="max-w-2xl mx-auto px-4 py-10">
@@ -25,9 +29,9 @@ export default function WifiSpotsPage() {
         </div>
       )}
 
-      {!isLoading && !error && Array.isArray(data) && (
+      {!isLoading && !error && data && (
         <ul className="space-y-6">
-          {data.map((spot) => (
+          {spots.map((spot) => (
             <li
               key={spot.id}
               className="bg-white p-5 rounded-2xl shadow-md flex gap-4 items-center border border-yellow-50 hover:shadow-xl hover:-translate-y-1 transition-all duration-200"
@@ -43,6 +47,8 @@ export default function WifiSpotsPage() {
           ))}
         </ul>
       )}
+
+      <LoadMoreButton next={data?.next} loading={isFetching} onLoad={setCursor} />
     </div>
   );
 }
@@ -50,12 +50,13 @@ function buildSlides(
 
 
 export default function ContentSlideshow() {
-  const { data: venues, isLoading: venuesLoading } = useGetVenuesQuery();
-  const { data: popupVenues, isLoading: popupLoading } = useGetPopupVenuesQuery();
-  const { data: schoolPrograms, isLoading: schoolLoading } = useGetSchoolProgramsQuery();
+  // The first page of each list is plenty for a slideshow.
+  const { data: venues, isLoading: venuesLoading } = useGetVenuesQuery({});
+  const { data: popupVenues, isLoading: popupLoading } = useGetPopupVenuesQuery(null);
+  const { data: schoolPrograms, isLoading: schoolLoading } = useGetSchoolProgramsQuery(null);
 
   const slides: SlideItem[] = useMemo(
-    () => buildSlides(venues ?? [], popupVenues ?? [], schoolPrograms ?? []),
+    () => buildSlides(venues?.results ?? [], popupVenues?.results ?? [], schoolPrograms?.results ?? []),
     [venues, popupVenues, schoolPrograms]
   );
 
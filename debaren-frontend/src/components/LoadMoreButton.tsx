@@ -0,0 +1,25 @@
+// components/LoadMoreButton.tsx
+// Fetches the next keyset page of a list; hidden once the last page is loaded.
+export default function LoadMoreButton({
+  next,
+  loading,
+  onLoad,
+}: {
+  next?: string | null;
+  loading: boolean;
+  onLoad: (cursor: string) => void;
+}) {
+  if (!next) return null;
+  return (
+    <div className="mt-10 flex justify-center">
+      <button
+        type="button"
+        disabled={loading}
+        onClick={() => onLoad(next)}
+        className="px-6 py-2 rounded-full bg-yellow-600 text-white hover:bg-yellow-700 transition disabled:opacity-60"
+      >
+        {loading ? "Loading..." : "Load more"}
+      </button>
+    </div>
+  );
+}
@@ -4,6 +4,21 @@ import axios from "axios";
 import { VenueFormInput } from "@/types/content";
 
 import { geocodeAddress } from "@/utils/geocode"; // Your Google Geocode function
+import type { CursorPage } from "@/types/debaren";
+
+// The /api/ lists are cursor-paginated. Admin screens manage every row, so
+// they follow `next` in pages of ADMIN_PAGE_SIZE until the last one.
+const ADMIN_PAGE_SIZE = 100;
+async function fetchAllPages<T>(url: string): Promise<T[]> {
+  const items: T[] = [];
+  let next: string | null = `${url}?page_size=${ADMIN_PAGE_SIZE}`;
+  while (next) {
+    const { data }: { data: CursorPage<T> } = await axios.get(next);
+    items.push(...data.results);
+    next = data.next;
+  }
+  return items;
+}
 // ------ Types ------
 export interface PopupVenue { id: number; name: string; location: string; image: string; }
 export interface WifiSpot { id: number; name: string; address: string; }
@@ -16,8 +31,7 @@ export interface ContactMessage { id: number; name: string; email: string; messa
 
 // ------ Popup Venues ------
 export async function getPopupVenues(): Promise<PopupVenue[]> {
-  const { data } = await axios.get(`${baseAPI}/api/popup-venues/`);
-  return data;
+  return fetchAllPages<PopupVenue>(`${baseAPI}/api/popup-venues/`);
 }
 export async function createPopupVenue(data: Omit<PopupVenue, "id" | "image"> & { image?: File | null }): Promise<PopupVenue> {
   const formData = new FormData();
@@ -41,8 +55,7 @@ export async function deletePopupVenue(id: number): Promise<void> {
 
 // ------ Wifi Spots ------
 export async function getWifiSpots(): Promise<WifiSpot[]> {
-  const { data } = await axios.get(`${baseAPI}/api/wifi-spots/`);
-  return data;
+  return fetchAllPages<WifiSpot>(`${baseAPI}/api/wifi-spots/`);
 }
 export async function createWifiSpot(data: Omit<WifiSpot, "id">): Promise<WifiSpot> {
   const res = await axios.post(`${baseAPI}/api/wifi-spots/`, data);
@@ -58,8 +71,7 @@ export async function deleteWifiSpot(id: number): Promise<void> {
 
 // ------ School Programs ------
 export async function getSchoolPrograms(): Promise<SchoolProgram[]> {
-  const { data } = await axios.get(`${baseAPI}/api/school-programs/`);
-  return data;
+  return fetchAllPages<SchoolProgram>(`${baseAPI}/api/school-programs/`);
 }
 export async function createSchoolProgram(data: Omit<SchoolProgram, "id" | "image"> & { image?: File | null }): Promise<SchoolProgram> {
   const formData = new FormData();
@@ -126,8 +138,7 @@ export async function updateHeroSection(data: Omit<HeroSection, never>): Promise
 
 // ------ Contact Messages ------
 export async function getContactMessages(): Promise<ContactMessage[]> {
-  const { data } = await axios.get(`${baseAPI}/api/contact-messages/`);
-  return data;
+  return fetchAllPages<ContactMessage>(`${baseAPI}/api/contact-messages/`);
 }
 
 // ------ Venue CRUD ------
@@ -146,8 +157,7 @@ export async function getContactMessages(): Promise<ContactMessage[]> {
 
 
 export async function getVenues(): Promise<Venue[]> {
-  const { data } = await axios.get(`${baseAPI}/api/venues/`);
-  return data;
+  return fetchAllPages<Venue>(`${baseAPI}/api/venues/`);
 }
 
 // @/services/contentService.ts
@@ -10,26 +10,60 @@ import type {
   VenueType,
   Booking,
   BookingForm,
+  CursorPage,
 } from "@/types/debaren"; // Add Booking and BookingForm to your types!
 import { baseAPI } from "@/utils/variables";
 import { Venue } from "@/types/content";
 
+export interface VenueListArgs {
+  q?: string;
+  cursor?: string | null;
+}
+
+// List endpoints return one keyset page at a time. Passing a page's `next`
+// URL as the argument appends the following page to the cached list.
+function appendPage<T>(cache: CursorPage<T>, page: CursorPage<T>): CursorPage<T> {
+  return page.previous ? { ...page, results: [...cache.results, ...page.results] } : page;
+}
+
+const cursorPages = {
+  serializeQueryArgs: ({ endpointName }: { endpointName: string }) => endpointName,
+  forceRefetch: ({ currentArg, previousArg }: { currentArg?: unknown; previousArg?: unknown }) =>
+    currentArg !== previousArg,
+};
+
 export const debarenApi = createApi({
   reducerPath: "debarenApi",
   baseQuery: fetchBaseQuery({ baseUrl: `${baseAPI}/api/` }),
   endpoints: (builder) => ({
-    getVenues: builder.query<Venue[], void>({ query: () => "venues/" }),
-    getVenuesByType: builder.query<Venue[], VenueType>({
+    getVenues: builder.query<CursorPage<Venue>, VenueListArgs>({
+      query: ({ q, cursor }) => cursor || (q ? `venues/?q=${encodeURIComponent(q)}` : "venues/"),
+      // One cached list per search; cursors only extend it.
+      serializeQueryArgs: ({ queryArgs }) => queryArgs.q ?? "",
+      forceRefetch: ({ currentArg, previousArg }) =>
+        currentArg?.q !== previousArg?.q || currentArg?.cursor !== previousArg?.cursor,
+      merge: appendPage,
+    }),
+    getVenue: builder.query<Venue, string | number>({
+      query: (id) => `venues/${id}/`,
+    }),
+    getVenuesByType: builder.query<CursorPage<Venue>, VenueType>({
       query: (type) => `venues/?venue_type=${type}`,
     }),
-    getPopupVenues: builder.query<PopupVenue[], void>({
-      query: () => "popup-venues/",
+    getPopupVenues: builder.query<CursorPage<PopupVenue>, string | null>({
+      query: (cursor) => cursor || "popup-venues/",
+      ...cursorPages,
+      merge: appendPage,
     }),
-    getWifiSpots: builder.query<WifiSpot[], void>({
-      query: () => "wifi-spots/",
+    getWifiSpots: builder.query<CursorPage<WifiSpot>, string | null>({
+      query: (cursor) => cursor || "wifi-spots/",
+      ...cursorPages,
+      merge: appendPage,
     }),
-    getSchoolPrograms: builder.query<SchoolProgram[], void>({
-      query: () => "school-programs/",
+    getSchoolPrograms: builder.query<CursorPage<SchoolProgram>, string | null>({
+      query: (cursor) => cursor || "school-programs/",
+      ...cursorPages,
+      merge: appendPage,
     }),
     getAbout: builder.query<About, void>({
       query: () => "about/",
@@ -55,7 +89,7 @@ export const debarenApi = createApi({
       }),
     }),
     /** --- Get Bookings for Current User --- */
-    getUserBookings: builder.query<Booking[], number>({
+    getUserBookings: builder.query<CursorPage<Booking>, number>({
       query: (userId) => `bookings/?user_id=${userId}`,
     }),
 
@@ -64,6 +98,7 @@ export const debarenApi = createApi({
 
 export const {
   useGetVenuesQuery,
+  useGetVenueQuery,
   useGetVenuesByTypeQuery,
   useGetPopupVenuesQuery,
   useGetWifiSpotsQuery,
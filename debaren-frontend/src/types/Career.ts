@@ -11,7 +11,7 @@ export interface Career {
     id: number;
     full_name: string;
     email: string;
-    resume: string;
+    resume_url: string | null;
     cover_letter: string;
     submitted_at: string;
     career: Career;
@@ -2,6 +2,13 @@
 
 export type VenueType = 'country' | 'city' | 'town';
 
+/** One keyset page of an /api/ list endpoint. */
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
 
 
 
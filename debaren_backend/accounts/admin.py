@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 
+from core.softdelete import SoftDeleteAdminMixin
 from .models import UserProfile
 
 
@@ -10,9 +11,13 @@ from django.contrib.contenttypes.admin import GenericTabularInline
 
 
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ('user', 'job_title', 'get_departments', 'is_active')
+    list_select_related = ('user',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('user__groups')
 
     def get_departments(self, obj):
-        return ", ".join(obj.user.groups.values_list("name", flat=True))
+        return ", ".join(obj.departments)
     get_departments.short_description = "Departments"
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        from .authentication import connect_token_eviction
+
+        connect_token_eviction()
+        post_migrate.connect(create_login_keys, sender=self, dispatch_uid="accounts-login-keys")
+
+
+def create_login_keys(sender, using, **kwargs):
+    from .lookup import ensure_login_keys
+
+    ensure_login_keys(using)
@@ -1,10 +1,10 @@
 from django.template.loader import render_to_string
-from django.contrib.auth import authenticate, get_user_model
-from django.core.mail import send_mail
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from core.mail_queue import enqueue_mail
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from django.contrib.auth.tokens import default_token_generator
-from django.utils.timezone import now
 from .models import UserProfile
 from .serializers import UserProfileSerializer, UserSerializer
 from rest_framework.views import APIView
@@ -12,8 +12,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.decorators import permission_classes
-from rest_framework.authtoken.models import Token
-from django.conf import settings
+from .authentication import issue_token, revoke_tokens
+from .lookup import find_login_user, login_key_taken, login_keys_enforced
 from rest_framework.decorators import api_view
 from .serializers import UserWithProfileSerializer
 from rest_framework import generics, permissions
@@ -23,17 +23,6 @@ logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
-class UserListView(APIView):
-    permission_classes = [AllowAny]
-
-    def get(self, request):
-        print("📢 Fetching all users with profiles...")
-        users = User.objects.select_related("profile").all()
-        serializer = UserWithProfileSerializer(users, many=True)
-        print(f"✅ Found {len(users)} users.")
-        return Response(serializer.data)
-
-
 @permission_classes([AllowAny])
 class UserSignupView(APIView):
     def post(self, request):
@@ -50,23 +39,28 @@ class UserSignupView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if User.objects.filter(username=username).exists():
-            logger.error("Username already exists")
+        # The case-insensitive unique keys reject duplicates; only look up which one on failure.
+        # Without them (see ensure_login_keys) the lookup has to come first.
+        taken = None if login_keys_enforced() else login_key_taken(username, email)
+        if taken is None:
+            try:
+                with transaction.atomic():
+                    user = User.objects.create_user(
+                        username=username, email=email, password=password
+                    )
+            except IntegrityError:
+                taken = login_key_taken(username, email) or "username"
+        if taken is not None:
+            logger.error(f"Signup rejected: {taken} already exists")
+            if taken == "email":
+                return Response(
+                    {"error": "Email already exists."}, status=status.HTTP_400_BAD_REQUEST
+                )
             return Response(
                 {"error": "Username already exists."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-        if User.objects.filter(email=email).exists():
-            logger.error("Email already exists")
-            return Response(
-                {"error": "Email already exists."}, status=status.HTTP_400_BAD_REQUEST
-            )
-
-        user = User.objects.create_user(
-            username=username, email=email, password=password
-        )
-        token, created = Token.objects.get_or_create(user=user)
+        token = issue_token(user)
 
         return Response(
             {
@@ -86,18 +80,14 @@ class UserLoginView(APIView):
         username = request.data.get("username")
         password = request.data.get("password")
 
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
-            try:
-                user = User.objects.get(email=username)
-            except User.DoesNotExist:
-                print("user don't exist")
-                return Response(
-                    {"error": "User name don't exist"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-                
+        user = find_login_user(username)
+        if user is None:
+            print("user don't exist")
+            return Response(
+                {"error": "User name don't exist"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         # Detect soft-deleted user
         if hasattr(user, 'profile') and user.profile.is_deleted:
             return Response(
@@ -105,9 +95,11 @@ class UserLoginView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        user = authenticate(username=user.username, password=password)
+        # check_password re-hashes at the current cost when the stored hash is out of date.
+        if not (user.is_active and user.check_password(password)):
+            user = None
         if user is not None:
-            token, created = Token.objects.get_or_create(user=user)
+            token = issue_token(user)
             return Response(
                 {
                     "token": token.key,
@@ -178,10 +170,9 @@ class PasswordResetConfirmView(APIView):
                     },
                 )
 
-                send_mail(
+                enqueue_mail(
                     subject,
                     "",
-                    settings.DEFAULT_FROM_EMAIL,
                     [user.email],
                     html_message=message,
                 )
@@ -239,11 +230,10 @@ def delete_account_by_user_id(request):
         user = User.objects.get(id=user_id)
         user.is_active = False  # Disable login
         user.save()
+        revoke_tokens(user)
 
         if hasattr(user, 'profile'):
-            user.profile.is_deleted = True
-            user.profile.deleted_at = now()
-            user.profile.save()
+            user.profile.delete()
 
         return Response({"detail": "User account marked as deleted."}, status=status.HTTP_200_OK)
 
@@ -267,9 +257,7 @@ def restore_user_account(request):
         user.save()
 
         if hasattr(user, 'profile'):
-            user.profile.is_deleted = False
-            user.profile.deleted_at = None
-            user.profile.save()
+            user.profile.restore()
 
         return Response({"detail": "User account restored successfully."}, status=status.HTTP_200_OK)
 
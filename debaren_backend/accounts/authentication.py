@@ -0,0 +1,202 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+User = get_user_model()
+
+# Seconds a token stays valid after it is issued; None never expires it.
+TOKEN_EXPIRY = getattr(settings, "TOKEN_EXPIRY", None)
+# The shared tier is evicted on revocation, so it can hold entries for long.
+TOKEN_CACHE_ALIAS = getattr(settings, "TOKEN_CACHE_ALIAS", "default")
+TOKEN_CACHE_TIMEOUT = getattr(settings, "TOKEN_CACHE_TIMEOUT", 15 * 60)
+# The in-process tier is only evicted in the process that revokes, so its TTL
+# bounds how long other workers may keep accepting a revoked token.
+TOKEN_LOCAL_CACHE_SIZE = getattr(settings, "TOKEN_LOCAL_CACHE_SIZE", 1024)
+TOKEN_LOCAL_CACHE_TTL = getattr(settings, "TOKEN_LOCAL_CACHE_TTL", 5)
+# What a request needs of its user; anything else (the password hash included)
+# is never cached and loads from the database if something does ask for it.
+TOKEN_USER_FIELDS = getattr(
+    settings, "TOKEN_USER_FIELDS",
+    ("id", "username", "email", "first_name", "last_name", "is_active", "is_staff", "is_superuser"),
+)
+
+
+class LocalLRU:
+    """A small thread-safe LRU whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, deadline = entry
+            if deadline < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_local = LocalLRU(TOKEN_LOCAL_CACHE_SIZE, TOKEN_LOCAL_CACHE_TTL)
+
+
+def token_cache():
+    return caches[TOKEN_CACHE_ALIAS]
+
+
+def shared_cache_timeout():
+    """
+    How long the shared tier keeps an entry. A per-process backend is not
+    shared at all, so it gets no longer than the in-process tier.
+    """
+    if isinstance(token_cache(), LocMemCache):
+        return min(TOKEN_CACHE_TIMEOUT, TOKEN_LOCAL_CACHE_TTL)
+    return TOKEN_CACHE_TIMEOUT
+
+
+def _cache_key(key):
+    return f"auth-token:{key}"
+
+
+def token_expired(created):
+    return TOKEN_EXPIRY is not None and created + timedelta(seconds=TOKEN_EXPIRY) <= timezone.now()
+
+
+def evict_token(key):
+    _local.delete(key)
+    token_cache().delete(_cache_key(key))
+
+
+def evict_user_tokens(user_id):
+    for key in Token.objects.filter(user_id=user_id).values_list("key", flat=True):
+        evict_token(key)
+
+
+def issue_token(user):
+    """The user's token, replacing it first if it has expired."""
+    token, created = Token.objects.get_or_create(user=user)
+    if not created and token_expired(token.created):
+        token.delete()
+        token = Token.objects.create(user=user)
+    return token
+
+
+def revoke_tokens(user):
+    """Delete the user's tokens; the signals below evict them from both cache tiers."""
+    for token in Token.objects.filter(user=user):
+        token.delete()
+
+
+def _token_entry(token):
+    """What the caches hold for a token: plain column values, never live instances."""
+    user = token.user
+    fields = tuple(field.attname for field in User._meta.concrete_fields if field.attname in TOKEN_USER_FIELDS)
+    return user.pk, token.key, token.created, fields, tuple(getattr(user, name) for name in fields)
+
+
+def _from_entry(entry):
+    """A fresh ``(user, token)`` pair, so no instance is shared between requests."""
+    user_id, key, created, fields, values = entry
+    user = User.from_db(None, fields, values)
+    token = Token.from_db(None, ("key", "user_id", "created"), (key, user_id, created))
+    token.user = user
+    return user, token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    ``TokenAuthentication`` that resolves keys from an in-process LRU, then the
+    shared cache, and only then the Token + User join. Deleting a token or
+    changing its user evicts it; expired tokens are rejected.
+    """
+
+    def authenticate_credentials(self, key):
+        entry = _local.get(key)
+        if entry is None:
+            entry = token_cache().get(_cache_key(key))
+            if entry is None:
+                entry = _token_entry(self.load(key))
+                token_cache().set(_cache_key(key), entry, shared_cache_timeout())
+            _local.set(key, entry)
+
+        user, token = _from_entry(entry)
+        if token_expired(token.created):
+            evict_token(key)
+            raise exceptions.AuthenticationFailed("Token has expired.")
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+        return user, token
+
+    def load(self, key):
+        try:
+            return Token.objects.select_related("user").get(key=key)
+        except Token.DoesNotExist:
+            # Unknown keys are not cached, so a token issued afterwards works at once.
+            raise exceptions.AuthenticationFailed("Invalid token.")
+
+
+def _evict_deleted_token(sender, instance, **kwargs):
+    evict_token(instance.key)
+
+
+def _evict_saved_user(sender, instance, created, **kwargs):
+    # Covers deactivation (delete_account_by_user_id) and permission changes alike.
+    if not created:
+        evict_user_tokens(instance.pk)
+
+
+def _evict_user_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    # Group and permission changes go through the m2m tables, not User.save().
+    if not reverse:
+        if action.startswith("post_"):
+            evict_user_tokens(instance.pk)
+        return
+    if action == "pre_clear":
+        user_ids = instance.user_set.values_list("pk", flat=True)
+    elif action in ("post_add", "post_remove"):
+        user_ids = pk_set
+    else:
+        return
+    for user_id in list(user_ids):
+        evict_user_tokens(user_id)
+
+
+def connect_token_eviction():
+    post_delete.connect(_evict_deleted_token, sender=Token, dispatch_uid="auth-token-evict-delete")
+    post_save.connect(_evict_saved_user, sender=User, dispatch_uid="auth-token-evict-user")
+    m2m_changed.connect(_evict_user_relations, sender=User.groups.through, dispatch_uid="auth-token-evict-groups")
+    m2m_changed.connect(
+        _evict_user_relations, sender=User.user_permissions.through, dispatch_uid="auth-token-evict-permissions"
+    )
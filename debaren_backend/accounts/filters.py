@@ -0,0 +1,42 @@
+from functools import reduce
+from operator import or_
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+_BOOLEANS = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _split(raw):
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+class UserDirectoryFilter(BaseFilterBackend):
+    """
+    Directory filters: ``group`` (ids or names, comma-separated), ``is_active``
+    (true/false) and ``city`` (comma-separated, case-insensitive).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        groups = _split(params.get("group", ""))
+        if groups:
+            ids = [group for group in groups if group.isdigit()]
+            names = [group for group in groups if not group.isdigit()]
+            memberships = User.groups.through.objects.filter(Q(group_id__in=ids) | Q(group__name__in=names))
+            # A subquery rather than a join, so members of several groups are listed once.
+            queryset = queryset.filter(pk__in=memberships.values("user_id"))
+
+        active = params.get("is_active")
+        if active:
+            if active.lower() not in _BOOLEANS:
+                raise ValidationError({"is_active": "Must be true or false."})
+            queryset = queryset.filter(is_active=_BOOLEANS[active.lower()])
+
+        cities = _split(params.get("city", ""))
+        if cities:
+            queryset = queryset.filter(reduce(or_, (Q(profile__city__iexact=city) for city in cities)))
+        return queryset
@@ -0,0 +1,11 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 with the work factor taken from PASSWORD_PBKDF2_ITERATIONS. It keeps
+    the ``pbkdf2_sha256`` algorithm name, so existing hashes still verify and
+    are re-hashed at the configured cost the next time their user logs in.
+    """
+    iterations = getattr(settings, "PASSWORD_PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,99 @@
+import logging
+from functools import lru_cache
+
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, IntegrityError, connections, models
+from django.db.models.functions import Lower
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# auth.User belongs to Django, so these are created by the post_migrate hook
+# below rather than by a migration. Blank emails (guest or admin accounts) are
+# left out of the email key, so email lookups repeat HAS_EMAIL to match it.
+HAS_EMAIL = ~models.Q(email="")
+LOGIN_KEYS = [
+    models.UniqueConstraint(Lower("username"), name="auth_user_username_ci_uniq"),
+    models.UniqueConstraint(Lower("email"), condition=HAS_EMAIL, name="auth_user_email_ci_uniq"),
+]
+_FALLBACK_INDEXES = {
+    "auth_user_username_ci_uniq": models.Index(Lower("username"), name="auth_user_username_ci_idx"),
+    "auth_user_email_ci_uniq": models.Index(Lower("email"), name="auth_user_email_ci_idx"),
+}
+
+
+def ensure_login_keys(using="default"):
+    """
+    Create the case-insensitive username/email keys on the user table. If
+    existing rows already collide, a plain index is created instead so lookups
+    stay indexed; clean up the duplicates and migrate again to make it unique.
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        existing = connection.introspection.get_constraints(cursor, User._meta.db_table)
+    login_keys_enforced.cache_clear()
+    for constraint in LOGIN_KEYS:
+        fallback = _FALLBACK_INDEXES[constraint.name]
+        if constraint.name in existing:
+            continue
+        try:
+            with connection.schema_editor() as editor:
+                editor.add_constraint(User, constraint)
+        except (IntegrityError, DatabaseError) as exc:
+            logger.warning("Could not create %s (%s); using a non-unique index", constraint.name, exc)
+            if fallback.name not in existing:
+                with connection.schema_editor() as editor:
+                    editor.add_index(User, fallback)
+        else:
+            if fallback.name in existing:
+                with connection.schema_editor() as editor:
+                    editor.remove_index(User, fallback)
+
+
+@lru_cache(maxsize=None)
+def login_keys_enforced(using="default"):
+    """
+    Whether both unique login keys exist. When ``ensure_login_keys`` had to
+    fall back to plain indexes, duplicates are only caught by checking first.
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        existing = connection.introspection.get_constraints(cursor, User._meta.db_table)
+    return all(existing.get(key.name, {}).get("unique") for key in LOGIN_KEYS)
+
+
+def login_key(identifier):
+    return (identifier or "").strip().lower()
+
+
+def find_login_user(identifier):
+    """
+    The user whose username or email matches ``identifier`` case-insensitively,
+    in one indexed query. An exact username match wins over the email key.
+    """
+    key = login_key(identifier)
+    if not key:
+        return None
+    candidates = list(
+        User.objects.select_related("profile")
+        .annotate(username_key=Lower("username"), email_key=Lower("email"))
+        .filter(models.Q(username_key=key) | models.Q(HAS_EMAIL, email_key=key))[:3]
+    )
+    candidates.sort(key=lambda user: (user.username != identifier, user.username_key != key))
+    return candidates[0] if candidates else None
+
+
+def login_key_taken(username, email):
+    """Which of ``"username"``/``"email"`` already belongs to someone, checked in one query."""
+    username_key, email_key = login_key(username), login_key(email)
+    rows = (
+        User.objects.annotate(username_key=Lower("username"), email_key=Lower("email"))
+        .filter(models.Q(username_key=username_key) | models.Q(HAS_EMAIL, email_key=email_key))
+        .values_list("username_key", "email_key")[:2]
+    )
+    for taken_username, taken_email in rows:
+        if taken_username == username_key:
+            return "username"
+        if taken_email == email_key:
+            return "email"
+    return None
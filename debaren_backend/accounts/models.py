@@ -1,10 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+from core.softdelete import LIVE, SoftDeleteModel
+from core.storage import private_storage
+
 def upload_to(instance, filename):
     return f"user_files/{instance.user.username}/{filename}"
 
-class UserProfile(models.Model):
+class UserProfile(SoftDeleteModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
     phone_number = models.CharField(max_length=20, blank=True)
     address = models.CharField(max_length=255, blank=True)
@@ -15,14 +18,22 @@ class UserProfile(models.Model):
     is_active = models.BooleanField(default=True)
 
     # 📎 File uploads
-    cv = models.FileField(upload_to=upload_to, null=True, blank=True)
-    id_document = models.FileField(upload_to=upload_to, null=True, blank=True)
-    certificate = models.FileField(upload_to=upload_to, null=True, blank=True)
-    driver_license = models.ImageField(upload_to=upload_to, null=True, blank=True)
+    PRIVATE_FILE_FIELDS = ('cv', 'id_document', 'certificate', 'driver_license')
+    cv = models.FileField(upload_to=upload_to, storage=private_storage, null=True, blank=True)
+    id_document = models.FileField(upload_to=upload_to, storage=private_storage, null=True, blank=True)
+    certificate = models.FileField(upload_to=upload_to, storage=private_storage, null=True, blank=True)
+    driver_license = models.ImageField(upload_to=upload_to, storage=private_storage, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The directory's ?city= filter only ever wants live profiles.
+            models.Index(fields=['city'], condition=LIVE, name='profile_live_city_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
     @property
     def departments(self):
-        return self.user.groups.values_list('name', flat=True)
+        # .all() so a prefetch_related('user__groups') (or 'groups' from the user side) is reused.
+        return [group.name for group in self.user.groups.all()]
@@ -1,6 +1,10 @@
 from django.contrib.auth.models import User, Group
+from django.urls import reverse
 from rest_framework import serializers
 
+from core.mixins import SparseFieldsetMixin
+from core.softdelete import SOFT_DELETE_FIELDS
+
 from .models import UserProfile
 
 class GroupSerializer(serializers.ModelSerializer):
@@ -22,12 +26,22 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UserProfile
-        fields = '__all__'
+        exclude = SOFT_DELETE_FIELDS
 
     def get_departments(self, obj):
-        return list(obj.user.groups.values_list('name', flat=True))
-
-class UserWithProfileSerializer(serializers.ModelSerializer):
+        return obj.departments
+
+    def to_representation(self, instance):
+        # Documents live in private storage: point at the authenticated download view instead.
+        data = super().to_representation(instance)
+        request = self.context.get("request")
+        for name in UserProfile.PRIVATE_FILE_FIELDS:
+            if name in data and getattr(instance, name):
+                url = reverse("profile-document", args=[instance.user_id, name])
+                data[name] = request.build_absolute_uri(url) if request else url
+        return data
+
+class UserWithProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     profile = UserProfileSerializer(read_only=True)
 
     class Meta:
@@ -39,5 +53,6 @@ class UserWithProfileSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "is_staff",
+            "is_active",
             "profile",
         ]
\ No newline at end of file
@@ -1,3 +1,69 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework import exceptions
 
-# Create your tests here.
+from . import authentication
+from .authentication import CachedTokenAuthentication, _cache_key, _local, issue_token, revoke_tokens, token_cache
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        _local.clear()
+        token_cache().clear()
+        self.user = User.objects.create_user("ana", "ana@example.com", "pw")
+        self.token = issue_token(self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def assertRejected(self):
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_cache_hit_needs_no_query(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            user, token = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual((user.pk, token.key), (self.user.pk, self.token.key))
+
+    def test_each_request_gets_its_own_user(self):
+        first, _ = self.auth.authenticate_credentials(self.token.key)
+        second, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertIsNot(first, second)
+
+    def test_password_is_not_cached(self):
+        self.auth.authenticate_credentials(self.token.key)
+        entry = token_cache().get(_cache_key(self.token.key))
+        self.assertNotIn("password", entry[3])
+        self.assertNotIn(self.user.password, entry[4])
+
+    def test_deleted_token_is_rejected(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.token.delete()
+        self.assertRejected()
+
+    def test_deactivated_account_is_rejected(self):
+        # What delete_account_by_user_id does, minus the token deletion.
+        self.auth.authenticate_credentials(self.token.key)
+        self.user.is_active = False
+        self.user.save()
+        self.assertRejected()
+
+    def test_revoked_tokens_are_rejected(self):
+        self.auth.authenticate_credentials(self.token.key)
+        revoke_tokens(self.user)
+        self.assertRejected()
+
+    def test_group_change_evicts(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.user.groups.create(name="staff")
+        self.assertIsNone(_local.get(self.token.key))
+        self.assertIsNone(token_cache().get(_cache_key(self.token.key)))
+
+    def test_per_process_shared_tier_expires_quickly(self):
+        # Another worker's eviction never reaches a locmem cache, so its entries must not outlive the LRU's.
+        self.assertIsInstance(caches[authentication.TOKEN_CACHE_ALIAS], authentication.LocMemCache)
+        self.assertLessEqual(authentication.shared_cache_timeout(), authentication.TOKEN_LOCAL_CACHE_TTL)
+
+    @override_settings(CACHES={"tokens": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    def test_shared_backend_keeps_the_configured_timeout(self):
+        self.assertEqual(authentication.shared_cache_timeout(), authentication.TOKEN_CACHE_TIMEOUT)
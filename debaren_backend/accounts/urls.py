@@ -1,9 +1,9 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .auth import PasswordResetConfirmView, PasswordResetView, UserListView, UserLoginView, UserProfileView, UserSignupView, delete_account_by_user_id, get_user_profile, restore_user_account
-from .user_profile import update_user_profile
-from .views import UserViewSet, GroupViewSet
+from .auth import PasswordResetConfirmView, PasswordResetView, UserLoginView, UserProfileView, UserSignupView, delete_account_by_user_id, get_user_profile, restore_user_account
+from .user_profile import profile_document, update_user_profile
+from .views import UserListView, UserViewSet, GroupViewSet
 
 router = DefaultRouter()
 router.register(r'users', UserViewSet)
@@ -24,6 +24,7 @@ urlpatterns = [
     path("account/user/<int:user_id>/", UserProfileView.as_view(), name="user-profile"),
     path("account/profile/<int:user_id>/", get_user_profile, name="get-user-profile"),
     path("update/<int:user_id>/", update_user_profile, name="update-user-profile"),
+    path("account/profile/<int:user_id>/files/<str:field>/", profile_document, name="profile-document"),
     path("users/delete/", delete_account_by_user_id, name="delete_account_by_user_id"),
     path("users/restore/", restore_user_account, name="restore_user_account")
 ]
@@ -1,5 +1,6 @@
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
+from django.shortcuts import get_object_or_404
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from .models import UserProfile
@@ -8,6 +9,7 @@ from .serializers import (
     UserProfileSerializer,
     UserWithProfileSerializer,
 )
+from core.media_views import media_response
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,7 @@ def update_user_profile(request, user_id):
         print("❌ User not found.")
         return Response({"error": "User not found"}, status=404)
 
-    profile, created = UserProfile.objects.get_or_create(user=user)
+    profile, created = UserProfile.all_objects.get_or_create(user=user)
     if created:
         print("🆕 Created new UserProfile for user:", user.username)
     else:
@@ -82,4 +84,19 @@ def update_user_profile(request, user_id):
             "profile_errors": profile_serializer.errors if not profile_valid else {},
         },
         status=400,
-    )
\ No newline at end of file
+    )
+
+
+@api_view(["GET", "HEAD"])
+@permission_classes([IsAuthenticated])
+def profile_document(request, user_id, field):
+    """A profile document (CV, ID, certificate, licence), for its owner and staff only."""
+    if field not in UserProfile.PRIVATE_FILE_FIELDS:
+        return Response({"error": "Unknown document"}, status=404)
+    if request.user.pk != user_id and not request.user.is_staff:
+        return Response({"error": "Not allowed"}, status=403)
+    profile = get_object_or_404(UserProfile.all_objects, user_id=user_id)
+    document = getattr(profile, field)
+    if not document:
+        return Response({"error": "No such document"}, status=404)
+    return media_response(request, document.name, private=True)
@@ -1,13 +1,63 @@
 from django.contrib.auth.models import User, Group
 from rest_framework.permissions import AllowAny
-from rest_framework import viewsets
-from .serializers import UserSerializer, GroupSerializer
+from rest_framework import generics, viewsets
 
-class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all()
+from core.mixins import QueryPlanningMixin
+from core.pagination import RequiredCursorPagination
+from .filters import UserDirectoryFilter
+from .serializers import UserSerializer, GroupSerializer, UserWithProfileSerializer
+
+
+class UserDirectoryMixin(QueryPlanningMixin):
+    """
+    The paginated, filterable user directory. Profiles are joined and groups
+    prefetched, so a page costs the same few queries whatever its size.
+    """
+    queryset = User.objects.order_by('username', 'id')
+    directory_serializer_class = UserWithProfileSerializer
+    pagination_class = RequiredCursorPagination
+    cursor_ordering = ('username', 'id')
+
+    def is_directory(self):
+        return True
+
+    def get_serializer_class(self):
+        if self.is_directory():
+            return self.directory_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        if self.is_directory():
+            queryset = UserDirectoryFilter().filter_queryset(self.request, queryset, self)
+        return super().filter_queryset(queryset)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.is_directory():
+            requested = self.directory_serializer_class.requested_fields(self.request)
+            if requested is None or 'profile' in requested:
+                queryset = queryset.prefetch_related('groups')
+        return queryset
+
+
+class UserListView(UserDirectoryMixin, generics.ListAPIView):
+    permission_classes = [AllowAny]
+
+
+class UserViewSet(UserDirectoryMixin, viewsets.ModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [AllowAny]
 
+    def is_directory(self):
+        # /account/users/ lists the directory; the other actions keep UserSerializer.
+        return self.action == 'list'
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.is_directory():
+            queryset = queryset.prefetch_related('groups')
+        return queryset
+
     def create(self, request, *args, **kwargs):
         print("🚨 Payload:", request.data)
         response = super().create(request, *args, **kwargs)
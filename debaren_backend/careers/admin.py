@@ -1,12 +1,37 @@
 from django.contrib import admin
-from .models import Career, JobApplication
+from core.softdelete import SoftDeleteAdminMixin
+from .models import ApplicationStatusChange, Career, JobApplication
 
 @admin.register(Career)
-class CareerAdmin(admin.ModelAdmin):
-    list_display = ('title', 'location', 'created_at')
+class CareerAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    list_display = ('title', 'location', 'created_at', 'applications_total', 'applications_by_status')
     search_fields = ('title', 'location')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('application_counters')
+
+    @admin.display(description='Applications')
+    def applications_total(self, obj):
+        return sum(counter.count for counter in obj.application_counters.all())
+
+    @admin.display(description='By status')
+    def applications_by_status(self, obj):
+        labels = dict(JobApplication.STATUS_CHOICES)
+        counts = {counter.status: counter.count for counter in obj.application_counters.all() if counter.count}
+        return " · ".join(f"{labels[status]} {counts[status]}" for status in labels if status in counts) or "-"
+
+class ApplicationStatusChangeInline(admin.TabularInline):
+    model = ApplicationStatusChange
+    extra = 0
+    fields = ('from_status', 'to_status', 'changed_by', 'changed_at')
+    readonly_fields = fields
+    can_delete = False
+
+
 @admin.register(JobApplication)
 class JobApplicationAdmin(admin.ModelAdmin):
-    list_display = ('full_name', 'email', 'career', 'submitted_at')
+    inlines = [ApplicationStatusChangeInline]
+    list_display = ('full_name', 'email', 'career', 'submitted_at', 'resume_status')
+    list_filter = ('resume_status',)
+    readonly_fields = ('resume_status', 'resume_status_detail', 'hr_notified_at')
     search_fields = ('full_name', 'email', 'career__title')
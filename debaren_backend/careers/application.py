@@ -1,25 +1,69 @@
+import logging
+
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from django.core.mail import EmailMessage
-from django.conf import settings
-from django.template.loader import render_to_string
+from collections import defaultdict
+from django.db import transaction
+from core.emails import render_email, render_email_batch
 from rest_framework.pagination import PageNumberPagination
-import mimetypes
-from .models import JobApplication
-from .serializers import JobApplicationSerializer
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny, IsAdminUser
+from django.shortcuts import get_object_or_404
+from core.mail_queue import enqueue_mail, enqueue_mail_batch
+from core.media_views import media_response
+from core.pagination import RequiredCursorPagination
+from .filters import JobApplicationFilter
+from .models import ApplicationStatusChange, JobApplication
+from .resumes import application_for_token, resume_filename, schedule_resume_check
+from .stats import adjust_counters, status_change_deltas
+from .serializers import BulkStatusSerializer, JobApplicationListSerializer, JobApplicationSerializer
+
+
+logger = logging.getLogger(__name__)
 
 
-class JobApplicationPagination(PageNumberPagination):
+class NumberedApplicationPagination(PageNumberPagination):
     page_size = 5
 
 
+class JobApplicationPagination(RequiredCursorPagination):
+    """
+    Keyset pages over (submitted_at, id) for the HR listing. Requests with
+    ``?page=N`` keep the numbered pages of five, with ``count``.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.numbered = NumberedApplicationPagination() if "page" in request.query_params else None
+        if self.numbered:
+            return self.numbered.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.numbered:
+            return self.numbered.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
 class JobApplicationViewSet(viewsets.ModelViewSet):
-    queryset = JobApplication.objects.all().order_by('-submitted_at')
+    queryset = JobApplication.objects.select_related('career').order_by('-submitted_at', '-id')
     serializer_class = JobApplicationSerializer
     pagination_class = JobApplicationPagination
+    cursor_ordering = ('-submitted_at', '-id')
+    filter_backends = [JobApplicationFilter]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.defer('career__description', 'career__requirements')
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return JobApplicationListSerializer
+        return super().get_serializer_class()
+
     def create(self, request, *args, **kwargs):
         print("📥 [CREATE] Incoming data:", request.data)
         serializer = self.get_serializer(data=request.data)
@@ -49,49 +93,88 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         updated_status = serializer.validated_data.get('status')
         print("🟢 [UPDATE] Incoming status:", updated_status)
 
-        self.perform_update(serializer)
-        print("✅ [UPDATE] New saved status:", self.get_object().status)
+        with transaction.atomic():
+            self.perform_update(serializer)
+            application = serializer.instance
+            print("✅ [UPDATE] New saved status:", application.status)
 
-        if updated_status and updated_status != previous_status:
-            print("📨 [UPDATE] Status changed — triggering email...")
-            self.send_status_update_email(self.get_object())
-        else:
-            print("🚫 [UPDATE] No status change — skipping email")
+            if updated_status and updated_status != previous_status:
+                print("📨 [UPDATE] Status changed — triggering email...")
+                self.record_status_changes([application], previous_status)
+                self.send_status_update_email(application)
+            else:
+                print("🚫 [UPDATE] No status change — skipping email")
 
         return Response(serializer.data)
 
-    def send_hr_email(self, application):
-        try:
-            print("📧 [HR EMAIL] Sending HR email for:", application.full_name)
-            hr_html = render_to_string("emails/hr_notification.html", {
-                "full_name": application.full_name,
-                "email": application.email,
-                "title": application.career.title,
-                "location": application.career.location,
-                "cover_letter": application.cover_letter,
-            })
-
-            email = EmailMessage(
-                subject=f"New Application – {application.career.title}",
-                body=hr_html,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[settings.HR_NOTIFICATION_EMAIL],
+    @action(detail=False, methods=["post"], url_path="bulk-status", permission_classes=[IsAdminUser])
+    def bulk_status(self, request):
+        """Move many applications to one status: one UPDATE, one history insert, one email insert."""
+        serializer = BulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        new_status = serializer.validated_data["status"]
+
+        with transaction.atomic():
+            found = list(
+                JobApplication.objects.select_for_update(of=("self",))
+                .select_related("career")
+                .filter(pk__in=ids)
+                .only("id", "status", "language", "email", "full_name", "career__title")
             )
-            email.content_subtype = "html"
-
-            if application.resume:
-                resume_file = application.resume
-                mime_type, _ = mimetypes.guess_type(resume_file.name)
-                email.attach(
-                    resume_file.name,
-                    resume_file.read(),
-                    mime_type or 'application/octet-stream'
-                )
-
-            email.send(fail_silently=False)
-            print("✅ [HR EMAIL] Email sent")
-        except Exception as e:
-            print("❌ [HR EMAIL] Failed:", str(e))
+            changing = [application for application in found if application.status != new_status]
+            previous = {application.pk: application.status for application in changing}
+            JobApplication.objects.filter(pk__in=previous).update(status=new_status)
+            for application in changing:
+                application.status = new_status
+            # queryset.update() skips the signals that maintain the counters, so adjust them here.
+            adjust_counters(status_change_deltas(
+                (application.career_id, previous[application.pk], new_status) for application in changing
+            ))
+            self.record_status_changes(changing, previous)
+            enqueue_mail_batch(self.status_emails(changing))
+
+        logger.info("Bulk status: %d applications moved to %s, emails queued", len(changing), new_status)
+        found_ids = {application.pk for application in found}
+        return Response({
+            "status": new_status,
+            "updated": sorted(previous),
+            "unchanged": sorted(found_ids - set(previous)),
+            "missing": sorted(set(ids) - found_ids),
+        })
+
+    def record_status_changes(self, applications, previous):
+        """``previous`` is the old status, or a dict of old statuses by application id."""
+        user = self.request.user if self.request.user.is_authenticated else None
+        ApplicationStatusChange.objects.bulk_create([
+            ApplicationStatusChange(
+                application=application,
+                from_status=previous[application.pk] if isinstance(previous, dict) else previous,
+                to_status=application.status,
+                changed_by=user,
+            )
+            for application in applications
+        ])
+
+    def send_hr_email(self, application):
+        # The resume is format/virus checked off-request first; HR is emailed once that finishes.
+        print("📧 [HR EMAIL] Scheduling resume checks and HR email for:", application.full_name)
+        schedule_resume_check(application)
+
+    @action(detail=True, methods=["get"], url_path="resume", url_name="resume-download", permission_classes=[AllowAny])
+    def download_resume(self, request, pk=None):
+        """Resume download for the signed, expiring links in HR emails (staff need no token)."""
+        if request.user.is_staff:
+            application = get_object_or_404(JobApplication, pk=pk)
+        else:
+            application = application_for_token(request.query_params.get("token", ""))
+            if application is None or str(application.pk) != str(pk):
+                return Response({"detail": "This download link is invalid or has expired."}, status=status.HTTP_403_FORBIDDEN)
+        if application.resume_status != JobApplication.RESUME_CLEAN:
+            return Response({"detail": "This resume has not passed the file checks."}, status=status.HTTP_403_FORBIDDEN)
+        return media_response(
+            request, application.resume.name, filename=resume_filename(application), private=True,
+        )
 
     def send_applicant_email(self, application):
         try:
@@ -102,51 +185,56 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 "title": application.career.title,
             }
             template = "emails/pt/applicant_confirmation.html" if lang == 'pt' else "emails/en/applicant_confirmation.html"
-            html = render_to_string(template, context)
+            text, html = render_email(template, context)
 
-            confirmation = EmailMessage(
-                subject=f"Application Received – {application.career.title}",
-                body=html,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[application.email],
+            enqueue_mail(
+                f"Application Received – {application.career.title}",
+                text,
+                [application.email],
+                html_message=html,
             )
-            confirmation.content_subtype = "html"
-            confirmation.send(fail_silently=False)
-            print("✅ [APPLICANT EMAIL] Email sent")
+            print("✅ [APPLICANT EMAIL] Email queued")
         except Exception as e:
             print("❌ [APPLICANT EMAIL] Failed:", str(e))
 
     def send_status_update_email(self, application):
         try:
             print("📧 [STATUS EMAIL] Preparing status update email for:", application.email)
-            lang = getattr(application, 'language', 'en') or 'en'
-            context = {
-                "full_name": application.full_name,
-                "title": application.career.title,
-                "status": application.status,
-            }
-
-            email_data = self.get_subject_and_intro(lang, application.status, application.career.title)
-            print("✉️ [STATUS EMAIL] Subject:", email_data.get("subject"))
-            print("📝 [STATUS EMAIL] Intro:", email_data.get("intro"))
-
-            context["intro"] = email_data.get("intro", "")
-
-            template = f"emails/{lang}/status_update.html"
-            html = render_to_string(template, context)
-
-            email = EmailMessage(
-                subject=email_data.get("subject", f"Application Update – {application.career.title}"),
-                body=html,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[application.email],
-            )
-            email.content_subtype = "html"
-            email.send(fail_silently=False)
-            print("✅ [STATUS EMAIL] Sent successfully")
+            email = self.status_emails([application])[0]
+            print("✉️ [STATUS EMAIL] Subject:", email["subject"])
+            enqueue_mail(**email)
+            print("✅ [STATUS EMAIL] Queued successfully")
         except Exception as e:
             print("❌ [STATUS EMAIL] Failed:", str(e))
 
+    def status_emails(self, applications):
+        """Status update emails for ``applications``, rendering each language's template once."""
+        by_language = defaultdict(list)
+        for application in applications:
+            by_language[getattr(application, 'language', 'en') or 'en'].append(application)
+
+        emails = []
+        for lang, group in by_language.items():
+            contexts, subjects = [], []
+            for application in group:
+                email_data = self.get_subject_and_intro(lang, application.status, application.career.title)
+                subjects.append(email_data.get("subject", f"Application Update – {application.career.title}"))
+                contexts.append({
+                    "full_name": application.full_name,
+                    "title": application.career.title,
+                    "status": application.status,
+                    "intro": email_data.get("intro", ""),
+                })
+            rendered = render_email_batch(f"emails/{lang}/status_update.html", contexts)
+            for application, subject, (text, html) in zip(group, subjects, rendered):
+                emails.append({
+                    "subject": subject,
+                    "message": text,
+                    "recipient_list": [application.email],
+                    "html_message": html,
+                })
+        return emails
+
     def get_subject_and_intro(self, lang, status, title):
         status_map = {
             "en": {
@@ -0,0 +1,57 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+def _split(raw):
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+def _moment(params, name, end_of_day=False):
+    raw = params.get(name)
+    if not raw:
+        return None
+    try:
+        day = parse_date(raw)
+        if day is not None:
+            value = datetime.combine(day, time.max if end_of_day else time.min)
+        else:
+            value = parse_datetime(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise ValidationError({name: "Must be a date (YYYY-MM-DD) or an ISO 8601 datetime."})
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+class JobApplicationFilter(BaseFilterBackend):
+    """
+    HR filters for job applications: ``career`` (ids), ``status`` and
+    ``language`` (comma-separated for several values), and
+    ``submitted_after``/``submitted_before`` (inclusive dates or datetimes).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        careers = _split(params.get("career", ""))
+        if careers:
+            if not all(career.isdigit() for career in careers):
+                raise ValidationError({"career": "Must be career ids."})
+            queryset = queryset.filter(career_id__in=careers)
+
+        for name in ("status", "language"):
+            values = _split(params.get(name, ""))
+            if values:
+                queryset = queryset.filter(**{f"{name}__in": values})
+
+        after = _moment(params, "submitted_after")
+        if after is not None:
+            queryset = queryset.filter(submitted_at__gte=after)
+        before = _moment(params, "submitted_before", end_of_day=True)
+        if before is not None:
+            queryset = queryset.filter(submitted_at__lte=before)
+        return queryset
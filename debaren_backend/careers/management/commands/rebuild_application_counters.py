@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from careers.stats import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-career application counters from the applications table."
+
+    def handle(self, *args, **options):
+        rows = rebuild_counters()
+        self.stdout.write(self.style.SUCCESS(f"{rows} counter rows rebuilt"))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from careers.models import JobApplication
+from careers.resumes import process_application
+
+
+class Command(BaseCommand):
+    help = "Run the resume checks for applications still pending (e.g. after a restart or scanner outage) and notify HR."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--no-notify", action="store_true", help="Record the result without emailing HR (for backfills).")
+
+    def handle(self, *args, **options):
+        pending = JobApplication.objects.filter(resume_status=JobApplication.RESUME_PENDING).values_list("pk", flat=True)
+        counts = {}
+        for pk in pending.iterator():
+            application = process_application(pk, notify=not options["no_notify"])
+            counts[application.resume_status] = counts.get(application.resume_status, 0) + 1
+        summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "nothing pending"
+        self.stdout.write(self.style.SUCCESS(summary))
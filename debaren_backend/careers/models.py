@@ -1,13 +1,22 @@
+from django.contrib.auth.models import User
 from django.db import models
 
+from core.softdelete import LIVE, SoftDeleteModel
+from core.storage import private_storage
 
-class Career(models.Model):
+
+class Career(SoftDeleteModel):
     title = models.CharField(max_length=255)
     location = models.CharField(max_length=100)
     description = models.TextField()      # ← Accepts HTML from CKEditor in frontend
     requirements = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at'], condition=LIVE, name='career_live_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -26,15 +35,65 @@ class JobApplication(models.Model):
     ('pt', 'Português'),
 ]
 
+    RESUME_PENDING = 'pending'
+    RESUME_CLEAN = 'clean'
+    RESUME_REJECTED = 'rejected'
+    RESUME_STATUS_CHOICES = [
+        (RESUME_PENDING, 'Pending checks'),
+        (RESUME_CLEAN, 'Clean'),
+        (RESUME_REJECTED, 'Rejected'),
+    ]
+
     career = models.ForeignKey(Career, on_delete=models.CASCADE, related_name='applications')
     language = models.CharField(max_length=2, choices=LANGUAGE_CHOICES, default='en')
     full_name = models.CharField(max_length=255)
     email = models.EmailField()
-    resume = models.FileField(upload_to='resumes/')
+    resume = models.FileField(upload_to='resumes/', storage=private_storage)
+    resume_status = models.CharField(max_length=10, choices=RESUME_STATUS_CHOICES, default=RESUME_PENDING, editable=False)
+    resume_status_detail = models.CharField(max_length=255, blank=True, editable=False)
+    hr_notified_at = models.DateTimeField(null=True, blank=True, editable=False)
     cover_letter = models.TextField()
     submitted_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='submitted')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['career', 'status', '-submitted_at'], name='application_career_status_idx'),
+            models.Index(fields=['status', '-submitted_at'], name='application_status_idx'),
+            models.Index(fields=['-submitted_at', '-id'], name='application_submitted_idx'),
+        ]
+
     def __str__(self):
         return f"{self.full_name} - {self.career.title}"
 
+
+class ApplicationStatusChange(models.Model):
+    application = models.ForeignKey(JobApplication, on_delete=models.CASCADE, related_name='status_history')
+    from_status = models.CharField(max_length=20, choices=JobApplication.STATUS_CHOICES)
+    to_status = models.CharField(max_length=20, choices=JobApplication.STATUS_CHOICES)
+    changed_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-changed_at', '-id']
+        indexes = [
+            models.Index(fields=['application', '-changed_at'], name='status_change_app_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status} → {self.to_status}"
+
+
+class ApplicationCounter(models.Model):
+    """Number of applications per career and status, kept current by careers.stats."""
+    career = models.ForeignKey(Career, on_delete=models.CASCADE, related_name='application_counters')
+    status = models.CharField(max_length=20, choices=JobApplication.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['career', 'status'], name='unique_application_counter'),
+        ]
+
+    def __str__(self):
+        return f"{self.career_id} {self.status}: {self.count}"
@@ -0,0 +1,190 @@
+import logging
+import os
+import socket
+import struct
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core import signing
+from django.db import connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from core.emails import render_email
+from core.mail_queue import enqueue_mail
+from .models import JobApplication
+
+logger = logging.getLogger(__name__)
+
+MAX_RESUME_SIZE = getattr(settings, "RESUME_MAX_UPLOAD_SIZE", 5 * 1024 * 1024)
+RESUME_EXTENSIONS = (".pdf", ".doc", ".docx")
+# "link" puts an expiring signed download link in the HR email; "attach" attaches
+# the file (up to RESUME_ATTACH_MAX_SIZE, larger files still get a link).
+RESUME_DELIVERY = getattr(settings, "RESUME_DELIVERY", "link")
+RESUME_ATTACH_MAX_SIZE = getattr(settings, "RESUME_ATTACH_MAX_SIZE", 2 * 1024 * 1024)
+RESUME_LINK_MAX_AGE = getattr(settings, "RESUME_LINK_MAX_AGE", 7 * 24 * 60 * 60)
+# clamd INSTREAM endpoint: a unix socket path or "host:port". Empty skips the virus scan.
+CLAMAV_ADDRESS = getattr(settings, "CLAMAV_ADDRESS", "")
+CLAMAV_TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024
+
+_MAGIC = {
+    ".pdf": b"%PDF-",
+    ".doc": b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  # OLE2 compound document
+    ".docx": b"PK\x03\x04",
+}
+_SALT = "careers.resume"
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "RESUME_CHECK_WORKERS", 2),
+    thread_name_prefix="resume-check",
+)
+
+
+class ScannerUnavailable(Exception):
+    pass
+
+
+def resume_extension(name):
+    return os.path.splitext(name)[1].lower()
+
+
+def resume_filename(application):
+    return f"{application.full_name} - resume{resume_extension(application.resume.name)}"
+
+
+def resume_token(application):
+    # Binding the file name means replacing the resume invalidates old links.
+    return signing.dumps({"id": application.pk, "file": application.resume.name}, salt=_SALT, compress=True)
+
+
+def application_for_token(token):
+    """The application a link token grants, or ``None`` if it is forged, stale or expired."""
+    try:
+        payload = signing.loads(token, salt=_SALT, max_age=RESUME_LINK_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    return JobApplication.objects.filter(pk=payload["id"], resume=payload["file"]).first()
+
+
+def resume_download_url(application):
+    path = reverse("jobapplication-resume-download", args=[application.pk])
+    return f"{settings.BACKEND_URL.rstrip('/')}{path}?token={resume_token(application)}"
+
+
+def check_format(handle, extension):
+    """Reject files whose bytes do not match their extension."""
+    if not handle.read(len(_MAGIC[extension])).startswith(_MAGIC[extension]):
+        return f"The file is not a valid {extension[1:].upper()} document."
+    if extension == ".docx":
+        handle.seek(0)
+        try:
+            if "word/document.xml" not in zipfile.ZipFile(handle).namelist():
+                return "The file is not a valid DOCX document."
+        except zipfile.BadZipFile:
+            return "The file is not a valid DOCX document."
+    return None
+
+
+def clamav_scan(handle):
+    """Stream ``handle`` to clamd; return the signature name if infected, else ``None``."""
+    try:
+        if CLAMAV_ADDRESS.startswith("/"):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(CLAMAV_TIMEOUT)
+            sock.connect(CLAMAV_ADDRESS)
+        else:
+            host, port = CLAMAV_ADDRESS.rsplit(":", 1)
+            sock = socket.create_connection((host, int(port)), timeout=CLAMAV_TIMEOUT)
+        with sock:
+            sock.sendall(b"zINSTREAM\0")
+            for chunk in iter(lambda: handle.read(CHUNK_SIZE), b""):
+                sock.sendall(struct.pack("!L", len(chunk)) + chunk)
+            sock.sendall(struct.pack("!L", 0))
+            reply = b""
+            while not reply.endswith(b"\0"):
+                data = sock.recv(4096)
+                if not data:
+                    break
+                reply += data
+    except OSError as exc:
+        raise ScannerUnavailable(str(exc)) from exc
+
+    reply = reply.rstrip(b"\0").decode(errors="replace")
+    if reply.endswith("OK"):
+        return None
+    if reply.endswith("FOUND"):
+        return reply.split(":", 1)[-1].removesuffix("FOUND").strip()
+    raise ScannerUnavailable(reply)
+
+
+def check_resume(application):
+    """Run the format and virus checks and record the outcome on ``application``."""
+    extension = resume_extension(application.resume.name)
+    with application.resume.open("rb") as handle:
+        problem = check_format(handle, extension) if extension in _MAGIC else "Unsupported file type."
+        if problem is None and CLAMAV_ADDRESS:
+            handle.seek(0)
+            signature = clamav_scan(handle)
+            if signature:
+                problem = f"The file was flagged by the virus scanner ({signature})."
+
+    application.resume_status = JobApplication.RESUME_REJECTED if problem else JobApplication.RESUME_CLEAN
+    application.resume_status_detail = problem or ""
+    JobApplication.objects.filter(pk=application.pk).update(
+        resume_status=application.resume_status, resume_status_detail=application.resume_status_detail,
+    )
+    return application.resume_status
+
+
+def notify_hr(application):
+    """Queue the HR notification, linking (or attaching) the resume only if it passed the checks."""
+    clean = application.resume_status == JobApplication.RESUME_CLEAN
+    attach = clean and RESUME_DELIVERY == "attach" and application.resume.size <= RESUME_ATTACH_MAX_SIZE
+    hr_text, hr_html = render_email("emails/hr_notification.html", {
+        "full_name": application.full_name,
+        "email": application.email,
+        "title": application.career.title,
+        "location": application.career.location,
+        "cover_letter": application.cover_letter,
+        "resume_attached": attach,
+        "resume_url": resume_download_url(application) if clean and not attach else "",
+        "resume_link_days": RESUME_LINK_MAX_AGE // (24 * 60 * 60),
+        "resume_problem": application.resume_status_detail,
+    })
+    enqueue_mail(
+        f"New Application – {application.career.title}",
+        hr_text,
+        [settings.HR_NOTIFICATION_EMAIL],
+        html_message=hr_html,
+        attachments=[{"path": application.resume.name, "filename": resume_filename(application), "private": True}] if attach else [],
+    )
+    JobApplication.objects.filter(pk=application.pk).update(hr_notified_at=timezone.now())
+
+
+def process_application(application_id, notify=True):
+    application = JobApplication.objects.select_related("career").get(pk=application_id)
+    try:
+        check_resume(application)
+    except ScannerUnavailable as exc:
+        # Left pending; the scan_resumes command retries it.
+        logger.warning("Virus scanner unavailable for application %s: %s", application_id, exc)
+        return application
+    if notify and application.hr_notified_at is None:
+        notify_hr(application)
+    return application
+
+
+def _process_safely(application_id):
+    try:
+        process_application(application_id)
+    except Exception:
+        logger.exception("Could not check the resume of application %s", application_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_resume_check(application):
+    """Check the resume and notify HR on the worker pool once the application is committed."""
+    transaction.on_commit(lambda: _executor.submit(_process_safely, application.pk))
@@ -1,10 +1,20 @@
+from django.urls import reverse
 from rest_framework import serializers
+from core.softdelete import SOFT_DELETE_FIELDS
 from .models import Career, JobApplication
+from .resumes import MAX_RESUME_SIZE, RESUME_EXTENSIONS, resume_extension
 
 class CareerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Career
-        fields = '__all__'
+        exclude = SOFT_DELETE_FIELDS
+
+
+class CareerSummarySerializer(serializers.ModelSerializer):
+    """Career as embedded in application listings, without the HTML description and requirements."""
+    class Meta:
+        model = Career
+        fields = ['id', 'title', 'location']
 
 
 class JobApplicationSerializer(serializers.ModelSerializer):
@@ -15,7 +25,9 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         source='career',
         write_only=True
     )
-    resume = serializers.FileField()
+    # Never echoed back: the file is private and leaves only through download_resume.
+    resume = serializers.FileField(write_only=True)
+    resume_url = serializers.SerializerMethodField()
 
     class Meta:
         model = JobApplication
@@ -26,9 +38,34 @@ class JobApplicationSerializer(serializers.ModelSerializer):
             'full_name',
             'email',
             'resume',
+            'resume_url',
             'language',
             'cover_letter',
             'submitted_at',
             'status',
+            'resume_status',
         ]
-        read_only_fields = ['submitted_at']  # ✅ removed 'status'
+        read_only_fields = ['submitted_at', 'resume_status']  # ✅ removed 'status'
+
+    def get_resume_url(self, obj):
+        """The staff-only download route (no token); ``None`` for everyone else."""
+        request = self.context.get("request")
+        if request is None or not request.user.is_staff:
+            return None
+        return request.build_absolute_uri(reverse("jobapplication-resume-download", args=[obj.pk]))
+
+    def validate_resume(self, value):
+        if value.size > MAX_RESUME_SIZE:
+            raise serializers.ValidationError(f"Resume must be smaller than {MAX_RESUME_SIZE // (1024 * 1024)} MB.")
+        if resume_extension(value.name) not in RESUME_EXTENSIONS:
+            raise serializers.ValidationError("Upload a PDF, DOC or DOCX file.")
+        return value
+
+
+class JobApplicationListSerializer(JobApplicationSerializer):
+    career = CareerSummarySerializer(read_only=True)
+
+
+class BulkStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000)
+    status = serializers.ChoiceField(choices=JobApplication.STATUS_CHOICES)
@@ -0,0 +1,42 @@
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import JobApplication
+from .stats import adjust_counters
+
+
+def _counted_key(instance):
+    # Read straight from __dict__ so deferred fields are never fetched just to track them.
+    return instance.__dict__.get("career_id"), instance.__dict__.get("status")
+
+
+@receiver(post_init, sender=JobApplication, dispatch_uid="application-counter-track")
+def remember_counted_key(sender, instance, **kwargs):
+    instance._counted_key = _counted_key(instance)
+
+
+@receiver(post_save, sender=JobApplication, dispatch_uid="application-counter-save")
+def count_application(sender, instance, created, **kwargs):
+    key = _counted_key(instance)
+    previous_career, previous_status = instance._counted_key
+    if not created and previous_career is None and previous_status is not None:
+        # Loaded with career deferred and not reassigned, so it cannot have changed.
+        previous_career = instance.career_id
+        key = (previous_career, key[1])
+    if created:
+        adjust_counters({key: 1})
+    elif previous_status is not None and key != (previous_career, previous_status):
+        adjust_counters({(previous_career, previous_status): -1, key: 1})
+    instance._counted_key = key
+
+
+@receiver(pre_delete, sender=JobApplication, dispatch_uid="application-counter-predelete")
+def remember_stored_key(sender, instance, **kwargs):
+    # The in-memory copy may be stale (bulk updates skip save()), so count what is stored.
+    instance._counted_key = JobApplication.objects.filter(pk=instance.pk).values_list("career_id", "status").first()
+
+
+@receiver(post_delete, sender=JobApplication, dispatch_uid="application-counter-delete")
+def uncount_application(sender, instance, **kwargs):
+    if instance._counted_key:
+        adjust_counters({instance._counted_key: -1})
@@ -0,0 +1,59 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import ApplicationCounter, JobApplication
+
+
+def adjust_counters(deltas):
+    """Apply ``{(career_id, status): delta}`` to the counter rows atomically."""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    with transaction.atomic():
+        # Only increments may need a new row; decrements always hit a counted one, and
+        # creating rows there would resurrect counters of a career being deleted.
+        ApplicationCounter.objects.bulk_create(
+            [ApplicationCounter(career_id=career_id, status=status) for (career_id, status), delta in deltas.items() if delta > 0],
+            ignore_conflicts=True,
+        )
+        for (career_id, status), delta in deltas.items():
+            ApplicationCounter.objects.filter(career_id=career_id, status=status).update(count=F("count") + delta)
+
+
+def status_change_deltas(changes):
+    """Counter deltas for ``(career_id, old_status, new_status)`` transitions."""
+    deltas = Counter()
+    for career_id, old_status, new_status in changes:
+        if old_status != new_status:
+            deltas[(career_id, old_status)] -= 1
+            deltas[(career_id, new_status)] += 1
+    return deltas
+
+
+def career_stats(career):
+    by_status = {status: 0 for status, _ in JobApplication.STATUS_CHOICES}
+    by_status.update(career.application_counters.values_list("status", "count"))
+    return {
+        "career": career.pk,
+        "title": career.title,
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+    }
+
+
+def rebuild_counters():
+    """Recompute every counter with one GROUP BY; repairs drift from raw SQL or imports."""
+    rows = (
+        JobApplication.objects.order_by()
+        .values("career_id", "status")
+        .annotate(total=Count("pk"))
+        .values_list("career_id", "status", "total")
+    )
+    with transaction.atomic():
+        ApplicationCounter.objects.all().delete()
+        ApplicationCounter.objects.bulk_create([
+            ApplicationCounter(career_id=career_id, status=status, count=total) for career_id, status, total in rows
+        ])
+    return ApplicationCounter.objects.count()
@@ -1,3 +1,107 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from core.testing import ListQueryCountMixin
+
+from .models import ApplicationCounter, Career, JobApplication
+from .stats import rebuild_counters
+
+
+class ListQueryCountTests(ListQueryCountMixin, TestCase):
+    def add_careers(self, count):
+        careers = Career.objects.bulk_create(
+            [Career(title=f"Role {i}", location="Maputo", description="<p>About</p>", requirements="-")
+             for i in range(count)]
+        )
+        JobApplication.objects.bulk_create([
+            JobApplication(career=career, full_name=f"Applicant {career.pk}", email="applicant@example.com",
+                           cover_letter="Hello", resume="blobs/resume.pdf")
+            for career in careers
+        ])
+
+    def test_career_list(self):
+        self.assertListQueries("/careers/careers/", 1, self.add_careers)
+
+    def test_job_application_list(self):
+        # applications joined to their career, one cursor page
+        self.assertListQueries("/careers/job-applications/", 1, self.add_careers)
+
+
+class ApplicationCounterTests(TestCase):
+    """The denormalised per-status counts must match a fresh GROUP BY after every kind of write."""
+
+    def setUp(self):
+        self.career = Career.objects.create(title="Engineer", location="Maputo", description="-", requirements="-")
+        self.other = Career.objects.create(title="Designer", location="Maputo", description="-", requirements="-")
+
+    def apply(self, career=None, status="submitted"):
+        return JobApplication.objects.create(
+            career=career or self.career, full_name="Applicant", email="applicant@example.com",
+            cover_letter="Hello", resume="blobs/resume.pdf", status=status,
+        )
+
+    def counts(self):
+        counters = ApplicationCounter.objects.exclude(count=0).values_list("career_id", "status", "count")
+        return {(career_id, status): count for career_id, status, count in counters}
+
+    def assertCounts(self, expected):
+        self.assertEqual(self.counts(), expected)
+        rebuild_counters()
+        self.assertEqual(self.counts(), expected)
+
+    def test_create(self):
+        self.apply()
+        self.apply(status="review")
+        self.assertCounts({(self.career.pk, "submitted"): 1, (self.career.pk, "review"): 1})
+
+    def test_status_change(self):
+        application = self.apply()
+        application.status = "approved"
+        application.save()
+        application.save()
+        self.assertCounts({(self.career.pk, "approved"): 1})
+
+    def test_status_change_with_career_deferred(self):
+        pk = self.apply().pk
+        application = JobApplication.objects.only("id", "status").get(pk=pk)
+        application.status = "rejected"
+        application.save(update_fields=["status"])
+        self.assertCounts({(self.career.pk, "rejected"): 1})
+
+    def test_career_change(self):
+        application = self.apply()
+        application.career = self.other
+        application.save()
+        self.assertCounts({(self.other.pk, "submitted"): 1})
+
+    def test_bulk_status(self):
+        applications = [self.apply(), self.apply(), self.apply(status="approved")]
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user("hr", "hr@example.com", "pw", is_staff=True))
+        response = client.post("/careers/job-applications/bulk-status/",
+                               {"ids": [a.pk for a in applications], "status": "approved"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertCounts({(self.career.pk, "approved"): 3})
+
+    def test_delete(self):
+        kept, deleted = self.apply(), self.apply(status="review")
+        deleted.delete()
+        self.assertCounts({(self.career.pk, "submitted"): 1})
+        kept.delete()
+        self.assertCounts({})
+
+    def test_delete_of_a_stale_instance(self):
+        application = self.apply()
+        # The copy in memory still says "submitted" after a queryset update
+        # (which skips the signals, so resync the counters by hand).
+        JobApplication.objects.filter(pk=application.pk).update(status="review")
+        rebuild_counters()
+        application.delete()
+        self.assertCounts({})
+
+    def test_queryset_delete(self):
+        self.apply()
+        self.apply(career=self.other)
+        JobApplication.objects.filter(career=self.career).delete()
+        self.assertCounts({(self.other.pk, "submitted"): 1})
@@ -1,9 +1,11 @@
 from django.core.mail import EmailMessage
 from django.conf import settings
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from .models import Career, JobApplication
 from .serializers import CareerSerializer, JobApplicationSerializer
+from .stats import career_stats
 from django.template.loader import render_to_string
 from rest_framework import viewsets, permissions
 
@@ -12,4 +14,9 @@ from rest_framework import viewsets, permissions
 class CareerViewSet(viewsets.ModelViewSet):
     queryset = Career.objects.all().order_by('-created_at')
     serializer_class = CareerSerializer
-    permission_classes = [permissions.AllowAny] 
+    permission_classes = [permissions.AllowAny]
+
+    @action(detail=True, methods=['get'], permission_classes=[permissions.IsAdminUser])
+    def stats(self, request, pk=None):
+        """Application counts per status, read from the maintained counter rows."""
+        return Response(career_stats(self.get_object()))
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from .models import (
     PopupVenue, About, FooterSocialLink,
-    HeroSection, ContactMessage
+    HeroSection, ContactMessage, OutboundEmail, DeadLetterEmail
 )
 
 admin.site.site_header = "African Rise Admin"
@@ -77,3 +77,32 @@ class ContactMessageAdmin(admin.ModelAdmin):
     def short_message(self, obj):
         return (obj.message[:60] + "...") if len(obj.message) > 60 else obj.message
     short_message.short_description = "Message"
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "to", "status", "attempts", "next_attempt_at", "created_at")
+    list_filter = ("status",)
+    search_fields = ("subject", "to")
+    readonly_fields = ("created_at", "locked_at", "last_error")
+    ordering = ("next_attempt_at",)
+
+
+@admin.register(DeadLetterEmail)
+class DeadLetterEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "to", "attempts", "failed_at")
+    search_fields = ("subject", "to", "last_error")
+    readonly_fields = ("created_at", "failed_at", "last_error")
+    ordering = ("-failed_at",)
+    actions = ["requeue"]
+
+    @admin.action(description="Requeue selected emails")
+    def requeue(self, request, queryset):
+        for dead in queryset:
+            OutboundEmail.objects.create(
+                subject=dead.subject, body=dead.body, html_body=dead.html_body,
+                from_email=dead.from_email, to=dead.to, attachments=dead.attachments,
+            )
+        count = queryset.count()
+        queryset.delete()
+        self.message_user(request, f"{count} email(s) requeued.")
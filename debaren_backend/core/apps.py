@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from . import views  # noqa: F401  registers the cached endpoints
+        from .caching import connect_invalidation
+        connect_invalidation()
+
+        from .images import connect_derivative_signals, image_models
+        for model in image_models():
+            connect_derivative_signals(model)
+
+        from .storage import connect_release
+        connect_release()
@@ -0,0 +1,92 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+CONTENT_CACHE_ALIAS = getattr(settings, "CONTENT_CACHE_ALIAS", "content")
+
+# model -> cache names of the endpoints rendering it, filled in by CachedContentMixin
+_dependents = {}
+
+
+def content_cache():
+    return caches[CONTENT_CACHE_ALIAS]
+
+
+def _version_key(name):
+    return f"content-version:{name}"
+
+
+def cache_version(name):
+    return content_cache().get_or_set(_version_key(name), 1, None)
+
+
+def invalidate(name):
+    cache = content_cache()
+    try:
+        cache.incr(_version_key(name))
+    except ValueError:
+        cache.set(_version_key(name), 2, None)
+
+
+def invalidate_model(model):
+    for name in _dependents.get(model, ()):
+        invalidate(name)
+
+
+def _invalidate_dependents(sender, **kwargs):
+    invalidate_model(sender)
+
+
+def connect_invalidation():
+    for model in _dependents:
+        post_save.connect(_invalidate_dependents, sender=model, dispatch_uid=f"content-cache-save-{model.__name__}")
+        post_delete.connect(_invalidate_dependents, sender=model, dispatch_uid=f"content-cache-delete-{model.__name__}")
+
+
+class CachedContentMixin:
+    """
+    Caches successful list/retrieve responses per URL and answers
+    ``If-None-Match`` with 304. Saving or deleting any of ``cache_models``
+    bumps the endpoint's version, which invalidates every cached URL at once.
+    """
+    cache_name = None
+    cache_models = ()
+    cache_timeout = None  # falls back to the cache alias' TIMEOUT
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_name:
+            for model in cls.cache_models:
+                _dependents.setdefault(model, set()).add(cls.cache_name)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        cache = content_cache()
+        # Keyed on the absolute URL: serialized image URLs embed the host.
+        key = f"content:{self.cache_name}:{cache_version(self.cache_name)}:{request.build_absolute_uri()}"
+        entry = cache.get(key)
+        if entry is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            body = JSONRenderer().render(response.data)
+            entry = (json.loads(body), f'"{hashlib.md5(body).hexdigest()}"')
+            timeout = self.cache_timeout if self.cache_timeout is not None else cache.default_timeout
+            cache.set(key, entry, timeout)
+
+        data, etag = entry
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("If-None-Match", ""):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, headers=headers)
@@ -1,8 +1,8 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from .mail_queue import enqueue_mail
+from .emails import render_email
 from django.conf import settings
 
 from .serializers import ContactMessageSerializer
@@ -33,15 +33,14 @@ class ContactFormView(APIView):
 
             View this message in the admin panel for full details.
                         """
-            EmailMultiAlternatives(
+            enqueue_mail(
                 subject_admin,
                 message_admin,
-                settings.DEFAULT_FROM_EMAIL,
                 [settings.CONTACT_EMAIL],
-            ).send()
+            )
 
             # --- Professional HTML Auto-reply to user
-            html_content = render_to_string(
+            text_content, html_content = render_email(
                 "contact_autoreply.html",
                 {
                     "name": name,
@@ -55,15 +54,12 @@ class ContactFormView(APIView):
                 }
             )
             subject_user = "Thank you for contacting Debaren!"
-            msg = EmailMultiAlternatives(
+            enqueue_mail(
                 subject_user,
-                # Fallback plain text (optional)
-                f"Hi {name},\n\nThank you for contacting Debaren. We'll reply soon.",
-                settings.DEFAULT_FROM_EMAIL,
+                text_content,
                 [email],
+                html_message=html_content,
             )
-            msg.attach_alternative(html_content, "text/html")
-            msg.send()
 
             return Response({"success": True, "detail": "Message sent!"}, status=status.HTTP_200_OK)
 
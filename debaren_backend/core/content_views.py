@@ -2,6 +2,8 @@ from rest_framework import viewsets, mixins
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from places.serializers import VenueSerializer
+from .mixins import QueryPlanningMixin
+from .pagination import RequiredCursorPagination
 from places.models import SchoolProgram, Venue, WifiSpot
 from .models import (
     PopupVenue, About,
@@ -13,7 +15,7 @@ from .serializers import (
     HeroSectionSerializer, ContactMessageSerializer
 )
 
-class VenueViewSet(viewsets.ModelViewSet):
+class VenueViewSet(QueryPlanningMixin, viewsets.ModelViewSet):
     queryset = Venue.objects.all()
     serializer_class = VenueSerializer
     parser_classes = [MultiPartParser, FormParser]
@@ -48,3 +50,4 @@ class HeroSectionViewSet(viewsets.ModelViewSet):
 class ContactMessageViewSet(viewsets.ModelViewSet):
     queryset = ContactMessage.objects.all()
     serializer_class = ContactMessageSerializer
+    pagination_class = RequiredCursorPagination
@@ -0,0 +1,71 @@
+import html
+import re
+
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils.html import strip_tags
+
+# Templates are compiled once by Django's cached template loader; the text
+# part comes from a pre-generated ``.txt`` twin (see ``build_email_text``)
+# instead of re-parsing every rendered HTML body.
+TEXT_SUFFIX = ".txt"
+
+_HIDDEN_BLOCKS = re.compile(r"<(head|style|script)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_LINKS = re.compile(r"<a\b[^>]*?href=\"([^\"]+)\"[^>]*>(.*?)</a\s*>", re.IGNORECASE | re.DOTALL)
+_LINE_BREAKS = re.compile(r"<br\s*/?>|</(p|div|h[1-6]|li|tr)\s*>", re.IGNORECASE)
+_LIST_ITEMS = re.compile(r"<li\b[^>]*>", re.IGNORECASE)
+# Filters whose output is HTML markup; in the text twin the raw value is what we want.
+_HTML_FILTERS = re.compile(
+    r"\|\s*(?:linebreaks|linebreaksbr|urlize|urlizetrunc|safe|safeseq)"
+    r"(?:\s*:\s*(?:\"[^\"]*\"|'[^']*'|[\w.]+))?(?=\s*(?:\||}}))"
+)
+_VARIABLES = re.compile(r"{{.*?}}", re.DOTALL)
+
+
+def html_to_text(source):
+    """Plain-text rendering of an HTML email body (or template source)."""
+    source = _HIDDEN_BLOCKS.sub("", source)
+    source = _LINKS.sub(lambda match: f"{match.group(2)} ({match.group(1)})", source)
+    source = _LIST_ITEMS.sub("\n- ", source)
+    source = _LINE_BREAKS.sub("\n", source)
+    text = html.unescape(strip_tags(source))
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip() + "\n"
+
+
+def text_template_source(source):
+    """
+    The ``.txt`` twin for an HTML email template's source. Autoescaping is for
+    HTML; the text part must keep &, < and quotes as typed.
+    """
+    source = _VARIABLES.sub(lambda match: _HTML_FILTERS.sub("", match.group(0)), source)
+    return "{% autoescape off %}" + html_to_text(source) + "{% endautoescape %}\n"
+
+
+def text_template_name(template_name):
+    return template_name.rsplit(".", 1)[0] + TEXT_SUFFIX
+
+
+def get_email_templates(template_name):
+    html_template = get_template(template_name)
+    try:
+        text_template = get_template(text_template_name(template_name))
+    except TemplateDoesNotExist:
+        text_template = None
+    return html_template, text_template
+
+
+def render_email(template_name, context):
+    """Return ``(text, html)`` for ``template_name``."""
+    return render_email_batch(template_name, [context])[0]
+
+
+def render_email_batch(template_name, contexts):
+    """Render one template for many recipients, resolving it only once."""
+    html_template, text_template = get_email_templates(template_name)
+    rendered = []
+    for context in contexts:
+        html_body = html_template.render(context)
+        text_body = text_template.render(context) if text_template else html_to_text(html_body)
+        rendered.append((text_body, html_body))
+    return rendered
@@ -0,0 +1,120 @@
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.signals import post_save
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from .caching import invalidate_model
+
+logger = logging.getLogger(__name__)
+
+# Derivative name -> maximum width in pixels. Height follows the aspect ratio.
+DERIVATIVE_WIDTHS = getattr(settings, "IMAGE_DERIVATIVE_WIDTHS", {
+    "thumbnail": 160,
+    "medium": 640,
+    "large": 1280,
+})
+WEBP_QUALITY = 80
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "IMAGE_DERIVATIVE_WORKERS", 2),
+    thread_name_prefix="image-derivatives",
+)
+
+
+def derivative_name(name, variant):
+    root, _ = posixpath.splitext(name)
+    return f"{root}.{variant}.webp"
+
+
+def generate_derivatives(name, storage=default_storage):
+    """Write every WebP derivative of the stored image ``name`` next to it."""
+    with storage.open(name, "rb") as handle:
+        original = ImageOps.exif_transpose(Image.open(handle))
+        original.load()
+    if original.mode not in ("RGB", "RGBA"):
+        original = original.convert("RGBA" if "transparency" in original.info else "RGB")
+
+    # Largest first: the thumbnail is written last and doubles as the readiness marker.
+    for variant, width in reversed(DERIVATIVE_WIDTHS.items()):
+        image = original.copy()
+        image.thumbnail((width, width * 10), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=4)
+        target = derivative_name(name, variant)
+        if storage.exists(target):
+            storage.delete(target)
+        storage.save(target, ContentFile(buffer.getvalue()))
+
+
+def _generate_safely(name, on_ready):
+    try:
+        generate_derivatives(name)
+    except Exception:
+        logger.exception("Could not build image derivatives for %s", name)
+        return
+    if on_ready is not None:
+        on_ready()
+
+
+def schedule_derivatives(name, on_ready=None):
+    """Build derivatives on the worker pool once the current transaction commits."""
+    transaction.on_commit(lambda: _executor.submit(_generate_safely, name, on_ready))
+
+
+def delete_derivatives(name, storage=default_storage):
+    for variant in DERIVATIVE_WIDTHS:
+        target = derivative_name(name, variant)
+        if storage.exists(target):
+            storage.delete(target)
+
+
+def has_derivatives(name, storage=default_storage):
+    return storage.exists(derivative_name(name, next(iter(DERIVATIVE_WIDTHS))))
+
+
+def image_models():
+    from places.models import SchoolProgram, Venue, VenueGalleryImage
+    from .models import About, PopupVenue
+    return (Venue, VenueGalleryImage, PopupVenue, SchoolProgram, About)
+
+
+def connect_derivative_signals(model, field_name="image"):
+    def on_save(sender, instance, **kwargs):
+        field_file = getattr(instance, field_name)
+        if field_file and not has_derivatives(field_file.name):
+            # Cached content responses rendered before the derivatives existed carry null variants.
+            schedule_derivatives(field_file.name, on_ready=lambda: invalidate_model(sender))
+
+    uid = f"image-derivatives-{model._meta.label_lower}-{field_name}"
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f"{uid}-save")
+    # Derivatives are removed together with their original by core.storage.release.
+
+
+class ImageDerivativesField(serializers.ReadOnlyField):
+    """
+    ``{"thumbnail": url, "medium": url, "large": url, "srcset": "..."}`` for an
+    image field, or ``null`` until the derivatives have been generated.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "image")
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value or not has_derivatives(value.name):
+            return None
+        request = self.context.get("request")
+        urls = {}
+        for variant in DERIVATIVE_WIDTHS:
+            url = default_storage.url(derivative_name(value.name, variant))
+            urls[variant] = request.build_absolute_uri(url) if request else url
+        urls["srcset"] = ", ".join(f"{urls[variant]} {width}w" for variant, width in DERIVATIVE_WIDTHS.items())
+        return urls
@@ -0,0 +1,162 @@
+import logging
+import smtplib
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.core.mail.backends.smtp import EmailBackend
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """Idle authenticated SMTP connections, keyed by server and credentials."""
+
+    def __init__(self):
+        self._idle = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def acquire(self, key, max_idle):
+        while True:
+            with self._lock:
+                if not self._idle[key]:
+                    return None
+                connection, released_at = self._idle[key].pop()
+            if time.monotonic() - released_at <= max_idle:
+                return connection
+            _quit_quietly(connection)
+
+    def release(self, key, connection, size):
+        with self._lock:
+            if len(self._idle[key]) >= size:
+                return False
+            self._idle[key].append((connection, time.monotonic()))
+            return True
+
+    def clear(self):
+        with self._lock:
+            idle = [connection for queue in self._idle.values() for connection, _ in queue]
+            self._idle.clear()
+        for connection in idle:
+            _quit_quietly(connection)
+
+
+class SendMetrics:
+    """Running per-message timing for the pooled backend."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.sent = 0
+        self.failed = 0
+        self.reconnects = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds, ok):
+        with self._lock:
+            if ok:
+                self.sent += 1
+            else:
+                self.failed += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def record_reconnect(self):
+        with self._lock:
+            self.reconnects += 1
+
+    def snapshot(self):
+        with self._lock:
+            attempts = self.sent + self.failed
+            return {
+                "sent": self.sent,
+                "failed": self.failed,
+                "reconnects": self.reconnects,
+                "avg_seconds": self.total_seconds / attempts if attempts else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+
+
+def _quit_quietly(connection):
+    try:
+        connection.quit()
+    except (smtplib.SMTPException, OSError):
+        try:
+            connection.close()
+        except OSError:
+            pass
+
+
+pool = ConnectionPool()
+metrics = SendMetrics()
+
+
+class PooledSMTPEmailBackend(EmailBackend):
+    """
+    SMTP backend that hands connections back to a process-wide pool on close()
+    instead of quitting, so consecutive sends skip the TLS handshake and login.
+    A pooled connection the server dropped is replaced transparently.
+
+    Settings: ``EMAIL_POOL_SIZE`` (idle connections kept per server, default 4)
+    and ``EMAIL_POOL_MAX_IDLE`` (seconds before an idle connection is discarded,
+    default 60).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_size = getattr(settings, "EMAIL_POOL_SIZE", 4)
+        self.max_idle = getattr(settings, "EMAIL_POOL_MAX_IDLE", 60)
+
+    @property
+    def pool_key(self):
+        return (self.host, self.port, self.username, self.use_ssl, self.use_tls)
+
+    def open(self):
+        if self.connection:
+            return False
+        pooled = pool.acquire(self.pool_key, self.max_idle)
+        if pooled is not None:
+            self.connection = pooled
+            return True
+        return super().open()
+
+    def close(self):
+        if self.connection is None:
+            return
+        if pool.release(self.pool_key, self.connection, self.pool_size):
+            self.connection = None
+            return
+        super().close()
+
+    def reconnect(self):
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            _quit_quietly(connection)
+        metrics.record_reconnect()
+        super().open()
+
+    def _send(self, email_message):
+        fail_silently, self.fail_silently = self.fail_silently, False
+        started = time.monotonic()
+        try:
+            try:
+                sent = super()._send(email_message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+                logger.info("Pooled SMTP connection went stale, reconnecting")
+                self.reconnect()
+                sent = super()._send(email_message)
+        except (smtplib.SMTPException, OSError):
+            metrics.record(time.monotonic() - started, ok=False)
+            if not fail_silently:
+                raise
+            return False
+        finally:
+            self.fail_silently = fail_silently
+        elapsed = time.monotonic() - started
+        metrics.record(elapsed, ok=sent)
+        logger.debug("Sent %r in %.3fs", email_message.subject, elapsed)
+        return sent
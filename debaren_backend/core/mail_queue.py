@@ -0,0 +1,168 @@
+import base64
+import logging
+import mimetypes
+import os
+from datetime import timedelta
+from email.mime.base import MIMEBase
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import DeadLetterEmail, OutboundEmail
+from .storage import private_storage
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = getattr(settings, "EMAIL_QUEUE_MAX_ATTEMPTS", 6)
+RETRY_BASE_SECONDS = getattr(settings, "EMAIL_QUEUE_RETRY_BASE_SECONDS", 30)
+RETRY_MAX_SECONDS = 60 * 60
+# A row stuck in "sending" longer than this belonged to a worker that died.
+LOCK_TIMEOUT = timedelta(minutes=10)
+# A multiple of 57 bytes, so every block encodes to whole 76-character base64 lines.
+ATTACHMENT_BLOCK_SIZE = 57 * 1024
+
+
+def enqueue_mail(subject, message, recipient_list, from_email=None, html_message=None, attachments=()):
+    """
+    Queue an email for the background worker; same arguments as ``send_mail``.
+    ``attachments`` are storage paths (e.g. ``FieldFile.name``) or
+    ``{"path": ..., "filename": ..., "private": bool}`` dicts, read at send
+    time; ``private`` reads from the private media storage.
+    """
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=message or "",
+        html_body=html_message or "",
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipient_list),
+        attachments=list(attachments),
+    )
+
+
+def enqueue_mail_batch(messages):
+    """
+    Queue many emails with one INSERT. ``messages`` are dicts with the
+    ``enqueue_mail`` argument names.
+    """
+    return OutboundEmail.objects.bulk_create([
+        OutboundEmail(
+            subject=message["subject"],
+            body=message.get("message") or "",
+            html_body=message.get("html_message") or "",
+            from_email=message.get("from_email") or settings.DEFAULT_FROM_EMAIL,
+            to=list(message["recipient_list"]),
+            attachments=list(message.get("attachments", ())),
+        )
+        for message in messages
+    ])
+
+
+def attachment_part(path, filename=None, storage=None):
+    """MIME part for a stored file, base64-encoded block by block instead of from one read()."""
+    mime_type, _ = mimetypes.guess_type(filename or path)
+    maintype, subtype = (mime_type or "application/octet-stream").split("/", 1)
+    encoded = []
+    with (storage or default_storage).open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(ATTACHMENT_BLOCK_SIZE), b""):
+            encoded.append(base64.encodebytes(block).decode("ascii"))
+    part = MIMEBase(maintype, subtype)
+    part.set_payload("".join(encoded))
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=filename or os.path.basename(path))
+    return part
+
+
+def build_message(email, connection=None):
+    if email.body or not email.html_body:
+        message = EmailMultiAlternatives(
+            email.subject, email.body, email.from_email, email.to, connection=connection,
+        )
+        if email.html_body:
+            message.attach_alternative(email.html_body, "text/html")
+    else:
+        message = EmailMultiAlternatives(
+            email.subject, email.html_body, email.from_email, email.to, connection=connection,
+        )
+        message.content_subtype = "html"
+    for attachment in email.attachments:
+        if isinstance(attachment, str):
+            attachment = {"path": attachment}
+        storage = private_storage if attachment.get("private") else None
+        message.attach(attachment_part(attachment["path"], attachment.get("filename"), storage))
+    return message
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS))
+
+
+def claim_batch(batch_size):
+    """Lock up to ``batch_size`` due emails for this worker."""
+    now = timezone.now()
+    due = OutboundEmail.objects.filter(
+        Q(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now)
+        | Q(status=OutboundEmail.STATUS_SENDING, locked_at__lt=now - LOCK_TIMEOUT)
+    ).values_list("pk", "status", "locked_at")[:batch_size]
+
+    claimed = []
+    for pk, current_status, locked_at in due:
+        # Compare-and-swap on the row so concurrent workers never share an email.
+        won = OutboundEmail.objects.filter(pk=pk, status=current_status, locked_at=locked_at).update(
+            status=OutboundEmail.STATUS_SENDING, locked_at=now,
+        )
+        if won:
+            claimed.append(pk)
+    return list(OutboundEmail.objects.filter(pk__in=claimed))
+
+
+def record_failure(email, error):
+    pk = email.pk
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts >= MAX_ATTEMPTS:
+        with transaction.atomic():
+            DeadLetterEmail.objects.create(
+                subject=email.subject, body=email.body, html_body=email.html_body,
+                from_email=email.from_email, to=email.to, attachments=email.attachments,
+                attempts=email.attempts, last_error=error, created_at=email.created_at,
+            )
+            email.delete()
+        logger.error("Email %s moved to dead letters after %s attempts: %s", pk, email.attempts, error)
+        return
+    email.status = OutboundEmail.STATUS_PENDING
+    email.locked_at = None
+    email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+    email.save(update_fields=["attempts", "last_error", "status", "locked_at", "next_attempt_at"])
+    logger.warning("Email %s failed (attempt %s), retrying: %s", pk, email.attempts, error)
+
+
+def process_queue(batch_size=50):
+    """Send one batch of due emails over a single connection. Returns (sent, failed)."""
+    batch = claim_batch(batch_size)
+    if not batch:
+        return 0, 0
+    sent = failed = 0
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        for email in batch:
+            record_failure(email, f"connection failed: {exc}")
+        return 0, len(batch)
+    try:
+        for email in batch:
+            try:
+                build_message(email, connection=connection).send()
+            except Exception as exc:
+                record_failure(email, str(exc))
+                failed += 1
+            else:
+                email.delete()
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
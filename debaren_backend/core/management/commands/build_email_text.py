@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.emails import TEXT_SUFFIX, text_template_source
+
+
+class Command(BaseCommand):
+    help = "Generate the plain-text .txt twin next to every HTML email template."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Only report twins that are missing or stale.")
+
+    def template_dirs(self):
+        for template_settings in settings.TEMPLATES:
+            yield from (Path(path) for path in template_settings.get("DIRS", []))
+        for app_config in apps.get_app_configs():
+            yield Path(app_config.path) / "templates"
+
+    def email_templates(self):
+        for directory in self.template_dirs():
+            if not directory.is_dir():
+                continue
+            yield from (directory / "emails").rglob("*.html")
+            yield from directory.glob("*autoreply*.html")
+
+    def handle(self, *args, **options):
+        stale = 0
+        for source in sorted(set(self.email_templates())):
+            twin = text_template_source(source.read_text(encoding="utf-8"))
+            target = source.with_suffix(TEXT_SUFFIX)
+            if target.exists() and target.read_text(encoding="utf-8") == twin:
+                continue
+            stale += 1
+            if options["check"]:
+                self.stdout.write(f"stale: {target}")
+            else:
+                target.write_text(twin, encoding="utf-8")
+                self.stdout.write(f"wrote {target}")
+        if options["check"] and stale:
+            raise SystemExit(1)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from core.images import generate_derivatives, has_derivatives, image_models
+
+
+class Command(BaseCommand):
+    help = "Build the WebP thumbnail/medium/large derivatives for images uploaded before they existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Rebuild derivatives that already exist.")
+
+    def handle(self, *args, **options):
+        for model in image_models():
+            built = failed = 0
+            names = model.objects.exclude(image="").exclude(image=None).values_list("image", flat=True)
+            for name in names.iterator():
+                if not options["force"] and has_derivatives(name):
+                    continue
+                try:
+                    generate_derivatives(name)
+                except (OSError, ValueError) as exc:
+                    failed += 1
+                    self.stderr.write(f"{name}: {exc}")
+                    continue
+                built += 1
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {built} built, {failed} failed"))
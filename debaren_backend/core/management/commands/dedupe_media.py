@@ -0,0 +1,106 @@
+import os
+import posixpath
+import shutil
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.template.defaultfilters import filesizeformat
+
+from core.images import DERIVATIVE_WIDTHS, derivative_name
+from core.storage import (
+    BLOB_FILE, blob_fields, blob_name, content_storage, file_digest, is_blob, is_referenced, release, storage_report,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move media referenced by file fields into content-addressed blobs, sharing one "
+        "copy between identical files, and report the disk space saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--report", action="store_true", help="Only print the current savings report.")
+        parser.add_argument("--prune", action="store_true", help="Also delete blobs that no row references.")
+        parser.add_argument("--dry-run", action="store_true", help="Show what would change without touching anything.")
+
+    def handle(self, *args, **options):
+        if not options["report"]:
+            self.migrate_legacy(options["dry_run"])
+            if options["prune"]:
+                self.prune(options["dry_run"])
+        self.print_report()
+
+    def legacy_names(self):
+        names = set()
+        for model, field in blob_fields(content_storage):
+            values = model._base_manager.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+            names.update(name for name in values.values_list(field, flat=True).distinct() if not is_blob(name))
+        return sorted(names)
+
+    def migrate_legacy(self, dry_run):
+        storage = content_storage
+        moved = shared = missing = 0
+        targets = set()
+        for name in self.legacy_names():
+            if not storage.exists(name):
+                missing += 1
+                self.stderr.write(f"missing: {name}")
+                continue
+            with storage.open(name, "rb") as handle:
+                target = blob_name(file_digest(File(handle)), posixpath.splitext(name)[1])
+            if target in targets or storage.exists(target):
+                shared += 1
+            else:
+                moved += 1
+            targets.add(target)
+            self.stdout.write(f"{name} -> {target}")
+            if dry_run:
+                continue
+
+            self.link(name, target)
+            with transaction.atomic():
+                for model, field in blob_fields(content_storage):
+                    model._base_manager.filter(**{field: name}).update(**{field: target})
+            storage.delete(name)
+            for variant in DERIVATIVE_WIDTHS:
+                self.link(derivative_name(name, variant), derivative_name(target, variant))
+                storage.delete(derivative_name(name, variant))
+
+        self.stdout.write(self.style.SUCCESS(f"{moved} moved, {shared} merged into an existing blob, {missing} missing"))
+
+    def link(self, source, target):
+        """Give ``target`` the bytes of ``source`` unless it already exists."""
+        source_path, target_path = content_storage.path(source), content_storage.path(target)
+        if not os.path.exists(source_path) or os.path.exists(target_path):
+            return
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copyfile(source_path, target_path)
+
+    def prune(self, dry_run):
+        root = content_storage.path("blobs")
+        deleted = 0
+        for directory, _, files in os.walk(root):
+            for filename in files:
+                if not BLOB_FILE.match(filename):
+                    continue  # derivatives go with their original
+                name = posixpath.join("blobs", os.path.relpath(os.path.join(directory, filename), root).replace(os.sep, "/"))
+                if is_referenced(name):
+                    continue
+                deleted += 1
+                self.stdout.write(f"orphan: {name}")
+                if not dry_run:
+                    release(name)
+        self.stdout.write(self.style.SUCCESS(f"{deleted} orphaned blobs {'found' if dry_run else 'deleted'}"))
+
+    def print_report(self):
+        report = storage_report()
+        self.stdout.write(
+            f"{report['references']} references to {report['files']} files "
+            f"({report['shared']} shared, {report['missing']} missing)\n"
+            f"logical {filesizeformat(report['logical_bytes'])}, on disk {filesizeformat(report['physical_bytes'])}, "
+            f"saved {filesizeformat(report['saved_bytes'])}"
+        )
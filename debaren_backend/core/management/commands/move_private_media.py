@@ -0,0 +1,35 @@
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.storage import blob_fields, content_storage, private_storage, release
+
+
+class Command(BaseCommand):
+    help = "Move resumes and identity documents saved before private storage existed out of the public media root."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="List what would move without touching anything.")
+
+    def handle(self, *args, **options):
+        moved = missing = 0
+        for model, field in blob_fields(private_storage):
+            rows = model._base_manager.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+            for name in rows.values_list(field, flat=True).distinct().iterator():
+                if private_storage.exists(name):
+                    continue
+                if not content_storage.exists(name):
+                    missing += 1
+                    self.stderr.write(f"missing: {name}")
+                    continue
+                moved += 1
+                self.stdout.write(f"{model._meta.label}.{field}: {name}")
+                if options["dry_run"]:
+                    continue
+                with content_storage.open(name, "rb") as handle:
+                    target = private_storage.save(name, File(handle))
+                with transaction.atomic():
+                    model._base_manager.filter(**{field: name}).update(**{field: target})
+                # Dropped from the public root unless a public field shares the same bytes.
+                release(name, content_storage)
+        self.stdout.write(self.style.SUCCESS(f"{moved} files moved to private storage, {missing} missing"))
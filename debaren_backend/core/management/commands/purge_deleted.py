@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.softdelete import SOFT_DELETE_RETENTION_DAYS, soft_delete_models
+
+
+class Command(BaseCommand):
+    help = "Permanently delete soft-deleted rows older than the retention period, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=SOFT_DELETE_RETENTION_DAYS,
+                            help="Only purge rows deleted more than N days ago.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="Count what would be purged without deleting.")
+
+    def handle(self, *args, **options):
+        for model in soft_delete_models():
+            expired = model.all_objects.expired(options["days"])
+            if options["dry_run"]:
+                self.stdout.write(f"{model._meta.label}: {expired.count()} rows would be purged")
+                continue
+            purged = 0
+            while True:
+                # Short transactions: each batch cascades and releases its files on its own.
+                batch = list(expired.order_by("pk").values_list("pk", flat=True)[:options["batch_size"]])
+                if not batch:
+                    break
+                with transaction.atomic():
+                    model.all_objects.filter(pk__in=batch).hard_delete()
+                purged += len(batch)
+            self.stdout.write(self.style.SUCCESS(f"{model._meta.label}: {purged} rows purged"))
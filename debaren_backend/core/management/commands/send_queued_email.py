@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.mail_queue import process_queue
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbound email. Runs until interrupted unless --once is given."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the due emails once and exit.")
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when the queue is idle.")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = process_queue(options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"sent={sent} failed={failed}")
+            if options["once"]:
+                if sent or failed:
+                    continue
+                return
+            if not (sent or failed):
+                time.sleep(options["interval"])
@@ -0,0 +1,148 @@
+import mimetypes
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, quote_etag
+from django.views.decorators.http import require_safe
+
+from .storage import blob_digest
+
+# "nginx" sends X-Accel-Redirect to MEDIA_ACCEL_PREFIX, "sendfile" sends X-Sendfile
+# (Apache mod_xsendfile, lighttpd); anything else streams the file from Django.
+MEDIA_ACCEL = getattr(settings, "MEDIA_ACCEL", "")
+MEDIA_ACCEL_PREFIX = getattr(settings, "MEDIA_ACCEL_PREFIX", "/protected-media/")
+PRIVATE_MEDIA_ACCEL_PREFIX = getattr(settings, "PRIVATE_MEDIA_ACCEL_PREFIX", "/protected-private-media/")
+# Where resumes and identity documents were saved under MEDIA_ROOT before they
+# moved to private storage; move_private_media relocates any left there.
+PRIVATE_MEDIA_PREFIXES = tuple(getattr(settings, "PRIVATE_MEDIA_PREFIXES", ("resumes/", "user_files/")))
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, no-cache"
+PRIVATE = "private, no-store"
+BLOCK_SIZE = 64 * 1024
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` inclusive for a single ``bytes=`` range, ``None`` when the
+    header should be ignored (absent, malformed or multi-range), or ``False``
+    when it cannot be satisfied.
+    """
+    match = _RANGE.match(header.strip()) if header else None
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the final N bytes.
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        while length > 0:
+            block = handle.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+
+
+@require_safe
+def serve_media(request, path):
+    name = posixpath.normpath(path).lstrip("/")
+    if name.startswith(PRIVATE_MEDIA_PREFIXES):
+        raise Http404("Media file not found")
+    return media_response(request, name)
+
+
+def media_response(request, name, cache_control=None, filename=None, private=False):
+    """
+    Respond with the media file ``name`` (relative to MEDIA_ROOT, or to
+    PRIVATE_MEDIA_ROOT when ``private``), honouring conditional and range
+    requests. ``filename`` makes it a download. Private files are never
+    cacheable; callers must have checked access already.
+    """
+    root = settings.PRIVATE_MEDIA_ROOT if private else settings.MEDIA_ROOT
+    try:
+        full_path = safe_join(root, name)
+        stat = os.stat(full_path)
+    except (OSError, ValueError, SuspiciousFileOperation):
+        raise Http404("Media file not found")
+    if not os.path.isfile(full_path):
+        raise Http404("Media file not found")
+
+    digest = blob_digest(name)
+    etag = quote_etag(digest or f"{stat.st_size:x}-{stat.st_mtime_ns:x}")
+    content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(stat.st_mtime),
+        # Blob names are the sha256 of their bytes, so the URL can never serve anything else.
+        "Cache-Control": PRIVATE if private else cache_control or (IMMUTABLE if digest else REVALIDATE),
+        "Accept-Ranges": "bytes",
+    }
+    if filename:
+        headers["Content-Disposition"] = content_disposition_header(True, filename)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if not_modified is not None:
+        for header, value in headers.items():
+            not_modified.headers.setdefault(header, value)
+        return not_modified
+
+    if MEDIA_ACCEL:
+        # The front server does the I/O, conditional requests and ranges itself.
+        response = HttpResponse(content_type=content_type, headers=headers)
+        if MEDIA_ACCEL == "nginx":
+            prefix = PRIVATE_MEDIA_ACCEL_PREFIX if private else MEDIA_ACCEL_PREFIX
+            response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + name
+        else:
+            response["X-Sendfile"] = full_path
+        return response
+
+    if request.method == "HEAD":
+        response = HttpResponse(content_type=content_type, headers=headers)
+        response["Content-Length"] = str(stat.st_size)
+        return response
+
+    byte_range = None
+    if request.headers.get("If-Range", etag) == etag:
+        byte_range = parse_range(request.headers.get("Range"), stat.st_size)
+    if byte_range is False:
+        response = HttpResponse(status=416, headers=headers)
+        response["Content-Range"] = f"bytes */{stat.st_size}"
+        return response
+    if byte_range:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _read_range(full_path, start, end - start + 1),
+            status=206,
+            content_type=content_type,
+            headers=headers,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+        response["Content-Length"] = str(end - start + 1)
+        return response
+
+    # FileResponse lets the WSGI server use sendfile(2) for whole-file responses.
+    return FileResponse(
+        open(full_path, "rb"), content_type=content_type, headers=headers,
+        as_attachment=bool(filename), filename=filename or "",
+    )
@@ -0,0 +1,72 @@
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that lets read requests trim the payload with
+    ``?fields=id,name,image``. Unknown names are ignored and writes always
+    see the full field set.
+    """
+    fields_query_param = "fields"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.requested_fields(self.context.get("request"))
+        if requested is None:
+            return
+        for name in set(self.fields) - requested:
+            self.fields.pop(name)
+
+    @classmethod
+    def requested_fields(cls, request):
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        raw = request.query_params.get(cls.fields_query_param)
+        if not raw:
+            return None
+        return {name.strip() for name in raw.split(",") if name.strip()}
+
+
+def plan_queryset(queryset, serializer_class, requested=None):
+    """
+    Apply select_related/prefetch_related for the nested serializers declared
+    on ``serializer_class`` so rendering a page costs a fixed number of queries.
+    """
+    select, prefetch = [], []
+    for name, field in serializer_class._declared_fields.items():
+        if requested is not None and name not in requested:
+            continue
+        if not isinstance(field, serializers.BaseSerializer) or field.write_only:
+            continue
+        source = field.source or name
+        if source == "*":
+            continue
+        source = source.replace(".", "__")
+        if isinstance(field, serializers.ListSerializer):
+            child_class = type(field.child)
+            related = child_class.Meta.model._default_manager.all()
+            prefetch.append(Prefetch(source, queryset=plan_queryset(related, child_class)))
+        else:
+            select.append(source)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+class QueryPlanningMixin:
+    """
+    Viewset mixin that derives the related-object loading strategy from the
+    serializer, honouring ``?fields=`` so trimmed responses skip the joins.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        requested = None
+        if issubclass(serializer_class, SparseFieldsetMixin):
+            requested = serializer_class.requested_fields(self.request)
+        return plan_queryset(queryset, serializer_class, requested)
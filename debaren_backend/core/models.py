@@ -1,10 +1,13 @@
 from django.db import models
+from django.utils import timezone
+
+from .storage import content_storage
 
 
 class PopupVenue(models.Model):
     name = models.CharField(max_length=200)
     location = models.CharField(max_length=200)
-    image = models.ImageField(upload_to='popup_venues/', blank=True)
+    image = models.ImageField(upload_to='popup_venues/', storage=content_storage, blank=True)
 
     def __str__(self):
         return self.name
@@ -21,7 +24,7 @@ class About(models.Model):
     phone = models.CharField(max_length=200)
     address = models.CharField(max_length=200)
     description = models.TextField()
-    image = models.ImageField(upload_to='about/', blank=True, null=True)
+    image = models.ImageField(upload_to='about/', storage=content_storage, blank=True, null=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
@@ -69,3 +72,52 @@ class ContactMessage(models.Model):
         return f"{self.name} ({self.email})"
 
 
+class OutboundEmail(models.Model):
+    """An email waiting to be delivered by the ``send_queued_email`` worker."""
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
+    ]
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    attachments = models.JSONField(default=list, blank=True, help_text="Storage paths of files to attach")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['next_attempt_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_email_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)}"
+
+
+class DeadLetterEmail(models.Model):
+    """An email that exhausted its retries; kept for inspection or manual requeue."""
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    attachments = models.JSONField(default=list, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    failed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-failed_at']
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)}"
@@ -0,0 +1,42 @@
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the API list endpoints.
+
+    As the project-wide default, paging is opt-in so clients that expect a
+    plain list keep working: it only kicks in when the request carries
+    ``?page_size=`` or a ``cursor`` from a previous page. The content
+    endpoints under ``/api/`` use ``RequiredCursorPagination`` instead.
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "id")
+    opt_in = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.opt_in and self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        # Views can pin their own keyset and ranked search results keep their
+        # rank; otherwise fall back to newest-first when the model has a
+        # created_at column, or the primary key.
+        ordering = getattr(view, "cursor_ordering", None)
+        if ordering:
+            return tuple(ordering)
+        if "search_rank" in queryset.query.annotations:
+            return ("search_rank",)
+        field_names = {field.name for field in queryset.model._meta.get_fields()}
+        if "created_at" in field_names:
+            return self.ordering
+        return ("-id",)
+
+
+class RequiredCursorPagination(DefaultCursorPagination):
+    """The same keyset pages, for endpoints that always paginate."""
+    opt_in = False
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from core.images import ImageDerivativesField
+
 from places.models import SchoolProgram, Venue, WifiSpot
 from .models import PopupVenue, About, FooterSocialLink, HeroSection, ContactMessage
 
@@ -7,6 +9,8 @@ from .models import PopupVenue, About, FooterSocialLink, HeroSection, ContactMes
 
 
 class PopupVenueSerializer(serializers.ModelSerializer):
+    image_variants = ImageDerivativesField()
+
     class Meta:
         model = PopupVenue
         fields = '__all__'
@@ -17,15 +21,19 @@ class WifiSpotSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class SchoolProgramSerializer(serializers.ModelSerializer):
+    image_variants = ImageDerivativesField()
+
     class Meta:
         model = SchoolProgram
         fields = '__all__'
         
         
 class AboutSerializer(serializers.ModelSerializer):
+    image_variants = ImageDerivativesField()
+
     class Meta:
         model = About
-        fields = ['title', 'description', 'image', 'updated_at']
+        fields = ['title', 'description', 'image', 'image_variants', 'updated_at']
 
 class FooterSocialLinkSerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib import admin
+from django.db import models, transaction
+from django.utils import timezone
+
+# Soft-deleted rows are kept this long before purge_deleted removes them for good.
+SOFT_DELETE_RETENTION_DAYS = getattr(settings, "SOFT_DELETE_RETENTION_DAYS", 30)
+
+# Condition for the partial indexes that only cover live rows.
+LIVE = models.Q(is_deleted=False)
+# Bookkeeping columns that API serializers leave out.
+SOFT_DELETE_FIELDS = ("is_deleted", "deleted_at")
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def alive(self):
+        return self.filter(is_deleted=False)
+
+    def dead(self):
+        return self.filter(is_deleted=True)
+
+    def delete(self):
+        """
+        Soft-delete each row through ``Model.delete()`` so post_save handlers
+        (cache and search index invalidation) still run.
+        """
+        with transaction.atomic(using=self.db):
+            rows = [obj for obj in self if not obj.is_deleted]
+            for obj in rows:
+                obj.delete()
+        return len(rows), {self.model._meta.label: len(rows)} if rows else {}
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def hard_delete(self):
+        return super().delete()
+
+    hard_delete.alters_data = True
+    hard_delete.queryset_only = True
+
+    def restore(self):
+        """Undelete each row through ``Model.restore()``, so the same post_save handlers run."""
+        with transaction.atomic(using=self.db):
+            rows = [obj for obj in self if obj.is_deleted]
+            for obj in rows:
+                obj.restore()
+        return len(rows)
+
+    restore.alters_data = True
+    restore.queryset_only = True
+
+    def expired(self, days=None):
+        days = SOFT_DELETE_RETENTION_DAYS if days is None else days
+        return self.filter(is_deleted=True, deleted_at__lt=timezone.now() - timedelta(days=days))
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Default manager: hides soft-deleted rows."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
+class SoftDeleteModel(models.Model):
+    """
+    ``delete()`` marks the row deleted instead of removing it; ``objects`` skips
+    such rows and ``all_objects`` sees everything. Foreign keys still resolve
+    to deleted rows because Django uses the plain base manager for them.
+    """
+    is_deleted = models.BooleanField(default=False, editable=False)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def delete(self, using=None, keep_parents=False):
+        self.is_deleted = True
+        self.deleted_at = timezone.now()
+        self.save(using=using, update_fields=["is_deleted", "deleted_at"])
+        return 1, {self._meta.label: 1}
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+    def restore(self):
+        self.is_deleted = False
+        self.deleted_at = None
+        self.save(update_fields=["is_deleted", "deleted_at"])
+
+
+class SoftDeleteAdminMixin:
+    """
+    ModelAdmin mixin that lists soft-deleted rows too (filterable by
+    ``is_deleted``) and adds a "Restore" action for them.
+    """
+    actions = ["restore_selected"]
+
+    def get_queryset(self, request):
+        queryset = self.model.all_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        return queryset.order_by(*ordering) if ordering else queryset
+
+    def get_list_display(self, request):
+        return (*super().get_list_display(request), "is_deleted")
+
+    def get_list_filter(self, request):
+        return (*super().get_list_filter(request), "is_deleted")
+
+    @admin.action(description="Restore selected deleted rows")
+    def restore_selected(self, request, queryset):
+        restored = queryset.restore()
+        self.message_user(request, f"{restored} rows restored.")
+
+
+def soft_delete_models():
+    return [model for model in apps.get_models() if issubclass(model, SoftDeleteModel)]
@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import posixpath
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.utils.deconstruct import deconstructible
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "blobs"
+BLOB_FILE = re.compile(r"^[0-9a-f]{64}(\.[^.]+)?$")
+
+
+def blob_name(digest, extension):
+    return f"{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}"
+
+
+def is_blob(name):
+    return name.startswith(f"{BLOB_PREFIX}/")
+
+
+def blob_digest(name):
+    """The sha256 a blob is named after, or ``None`` for any other file (derivatives included)."""
+    if not is_blob(name):
+        return None
+    filename = posixpath.basename(name)
+    return filename[:64] if BLOB_FILE.match(filename) else None
+
+
+def file_digest(content):
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores every upload once, under the sha256 of its bytes, whatever the
+    field's ``upload_to`` says. Saving a file that is already stored only
+    returns the existing name, so identical uploads share one blob on disk.
+    """
+
+    def __init__(self, **kwargs):
+        # Identical names mean identical bytes, so a concurrent writer can safely win.
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+
+    def _save(self, name, content):
+        name = blob_name(file_digest(content), posixpath.splitext(name)[1])
+        if self.exists(name):
+            return name
+        return super()._save(name, content)
+
+
+content_storage = ContentAddressedStorage()
+# Resumes and identity documents. No URL route serves this location; files
+# leave it only through authenticated or signed views.
+private_storage = ContentAddressedStorage(location=settings.PRIVATE_MEDIA_ROOT, base_url="/private-media/")
+
+
+def blob_fields(storage=None):
+    """``(model, field name)`` for every content-addressed file field, optionally of one storage."""
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, models.FileField) and isinstance(field.storage, ContentAddressedStorage):
+                if storage is None or field.storage.location == storage.location:
+                    yield model, field.name
+
+
+def reference_counts(storage=content_storage):
+    """How many rows, across all models, point at each name in ``storage``."""
+    counts = {}
+    for model, field in blob_fields(storage):
+        queryset = model._base_manager.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+        for name, count in queryset.values_list(field).annotate(count=models.Count("pk")).order_by():
+            counts[name] = counts.get(name, 0) + count
+    return counts
+
+
+def is_referenced(name, storage=content_storage):
+    return any(
+        model._base_manager.filter(**{field: name}).exists()
+        for model, field in blob_fields(storage)
+    )
+
+
+def release(name, storage=content_storage):
+    """Delete ``name`` and its image derivatives once no row references it."""
+    from .images import delete_derivatives
+
+    if not name or is_referenced(name, storage):
+        return False
+    storage.delete(name)
+    delete_derivatives(name, storage)
+    logger.info("Deleted orphaned media %s", name)
+    return True
+
+
+def _release_files(sender, instance, **kwargs):
+    for field in sender._meta.concrete_fields:
+        if isinstance(field, models.FileField) and isinstance(field.storage, ContentAddressedStorage):
+            name = getattr(instance, field.name).name
+            if name:
+                transaction.on_commit(lambda name=name, storage=field.storage: release(name, storage))
+
+
+def connect_release():
+    for model in {model for model, _ in blob_fields()}:
+        post_delete.connect(_release_files, sender=model, dispatch_uid=f"content-storage-release-{model._meta.label_lower}")
+
+
+def storage_report(storage=content_storage):
+    """Logical bytes referenced by rows versus physical bytes on disk."""
+    counts = reference_counts(storage)
+    logical = physical = missing = 0
+    for name, count in counts.items():
+        try:
+            size = storage.size(name)
+        except OSError:
+            missing += 1
+            continue
+        logical += size * count
+        physical += size
+    return {
+        "files": len(counts),
+        "references": sum(counts.values()),
+        "shared": sum(1 for count in counts.values() if count > 1),
+        "missing": missing,
+        "logical_bytes": logical,
+        "physical_bytes": physical,
+        "saved_bytes": logical - physical,
+    }
@@ -0,0 +1,19 @@
+from django.core.cache import caches
+from rest_framework.test import APIClient
+
+
+class ListQueryCountMixin:
+    """For ``TestCase``s checking that list endpoints cost the same number of queries whatever the row count."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+
+    def assertListQueries(self, url, queries, add_rows):
+        for rows in (3, 30):
+            add_rows(rows)
+            # Cached content responses would hide the queries being counted.
+            caches["content"].clear()
+            with self.subTest(rows=rows), self.assertNumQueries(queries):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
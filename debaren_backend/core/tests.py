@@ -1,3 +1,196 @@
-from django.test import TestCase
+import io
+import os
+import socketserver
+import threading
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.mail import EmailMessage
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from careers.models import Career
+from places.models import Venue
+from .mail_backends import PooledSMTPEmailBackend, metrics, pool
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    """
+    Minimal SMTP server on localhost: accepts any sender and recipient,
+    records delivered messages and counts sessions. ``drop_sessions()``
+    closes every open connection, like a server timing idle clients out.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.sessions = 0
+        self.messages = []
+        self.open_sockets = set()
+        self.lock = threading.Lock()
+
+    def drop_sessions(self):
+        with self.lock:
+            sockets, self.open_sockets = self.open_sockets, set()
+        for sock in sockets:
+            try:
+                sock.shutdown(2)
+            except OSError:
+                pass
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.sessions += 1
+            server.open_sockets.add(self.connection)
+        self.reply("220 localhost stand-in ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 localhost")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                for data in iter(self.rfile.readline, b""):
+                    if data in (b".\r\n", b".\n"):
+                        break
+                    body.append(data)
+                with server.lock:
+                    server.messages.append(b"".join(body))
+                self.reply("250 Queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class PooledSMTPEmailBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.server = SMTPStandIn()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(pool.clear)
+        pool.clear()
+        metrics.reset()
+        settings = override_settings(
+            EMAIL_HOST="127.0.0.1", EMAIL_PORT=self.server.server_address[1],
+            EMAIL_USE_SSL=False, EMAIL_USE_TLS=False, EMAIL_HOST_USER="", EMAIL_HOST_PASSWORD="",
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def send(self, subject):
+        message = EmailMessage(subject, "Body", "from@example.com", ["to@example.com"])
+        return PooledSMTPEmailBackend().send_messages([message])
+
+    def test_sends_reuse_one_session(self):
+        for n in range(5):
+            self.assertEqual(self.send(f"Message {n}"), 1)
+        self.assertEqual(len(self.server.messages), 5)
+        self.assertEqual(self.server.sessions, 1)
+        self.assertEqual(metrics.snapshot()["sent"], 5)
+
+    def test_batch_uses_one_session(self):
+        messages = [EmailMessage(f"Batch {n}", "Body", "from@example.com", ["to@example.com"]) for n in range(3)]
+        self.assertEqual(PooledSMTPEmailBackend().send_messages(messages), 3)
+        self.assertEqual(self.server.sessions, 1)
+
+    def test_reconnects_after_server_drops_connection(self):
+        self.assertEqual(self.send("Before"), 1)
+        self.server.drop_sessions()
+        self.assertEqual(self.send("After"), 1)
+        self.assertEqual(len(self.server.messages), 2)
+        self.assertEqual(self.server.sessions, 2)
+        self.assertEqual(metrics.snapshot()["reconnects"], 1)
+
+
+class SoftDeleteTests(TestCase):
+    def setUp(self):
+        self.career = Career.objects.create(title="Engineer", location="Maputo", description="-", requirements="-")
+
+    def test_delete_hides_the_row(self):
+        self.career.delete()
+        self.assertFalse(Career.objects.filter(pk=self.career.pk).exists())
+        row = Career.all_objects.get(pk=self.career.pk)
+        self.assertTrue(row.is_deleted)
+        self.assertIsNotNone(row.deleted_at)
+
+    def test_queryset_delete_and_restore_run_post_save(self):
+        saved = []
+        receiver = lambda sender, instance, **kwargs: saved.append(instance.pk)  # noqa: E731
+        post_save.connect(receiver, sender=Career)
+        self.addCleanup(post_save.disconnect, receiver, sender=Career)
+
+        self.assertEqual(Career.objects.filter(pk=self.career.pk).delete()[0], 1)
+        self.assertEqual(Career.all_objects.filter(pk=self.career.pk).restore(), 1)
+        self.assertEqual(saved, [self.career.pk, self.career.pk])
+        self.assertTrue(Career.objects.filter(pk=self.career.pk).exists())
+
+    def test_purge_deleted_removes_expired_rows_only(self):
+        recent = Career.objects.create(title="Recent", location="Maputo", description="-", requirements="-")
+        Career.objects.filter(pk__in=[self.career.pk, recent.pk]).delete()
+        Career.all_objects.filter(pk=self.career.pk).update(deleted_at=timezone.now() - timedelta(days=31))
+        call_command("purge_deleted", days=30, stdout=io.StringIO())
+        self.assertEqual(list(Career.all_objects.values_list("pk", flat=True)), [recent.pk])
+
+    def test_api_omits_bookkeeping_fields(self):
+        response = APIClient().get("/careers/careers/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("is_deleted", response.data[0])
+        self.assertNotIn("deleted_at", response.data[0])
+
+    def test_admin_lists_and_restores_deleted_rows(self):
+        self.career.delete()
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+        response = self.client.get("/admin/careers/career/")
+        self.assertContains(response, "Engineer")
+        self.client.post("/admin/careers/career/", {"action": "restore_selected", "_selected_action": [self.career.pk]})
+        self.assertTrue(Career.objects.filter(pk=self.career.pk).exists())
+
+    def test_partial_indexes_cover_live_rows(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Venue._meta.db_table)
+            self.assertIn("venue_live_created_idx", constraints)
+            if connection.vendor == "sqlite":
+                cursor.execute("SELECT sql FROM sqlite_master WHERE name = %s", ["venue_live_created_idx"])
+                self.assertIn("WHERE NOT", cursor.fetchone()[0])
+
+
+class ServeMediaTests(SimpleTestCase):
+    def put(self, name, data=b"data"):
+        path = os.path.join(settings.MEDIA_ROOT, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        self.addCleanup(os.remove, path)
+
+    def test_serves_public_files(self):
+        self.put("venues/hall.jpg")
+        response = self.client.get("/media/venues/hall.jpg")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"data")
+
+    def test_legacy_private_files_are_not_served(self):
+        self.put("resumes/cv.pdf")
+        self.put("user_files/ana/id.png")
+        for path in ("resumes/cv.pdf", "user_files/ana/id.png", "venues/../resumes/cv.pdf"):
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(f"/media/{path}").status_code, 404)
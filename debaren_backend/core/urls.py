@@ -1,12 +1,15 @@
 from django.urls import path, include
 
 from places.venue_view import VenueViewSet
-from places.views import BookingViewSet, VenueGalleryUploadView
+from places.views import (
+    BookingViewSet, GalleryUploadChunkView, GalleryUploadCompleteView, GalleryUploadSessionView,
+    VenueGalleryUploadView,
+)
 
 from .content_views import ContactMessageViewSet
 from .contact_views import ContactFormView
 from rest_framework.routers import DefaultRouter
-from .views import AboutDetailView, FooterSocialLinkListView, PopupVenueViewSet, WifiSpotViewSet, SchoolProgramViewSet, HeroSectionView
+from .views import AboutDetailView, BootstrapView, FooterSocialLinkListView, PopupVenueViewSet, WifiSpotViewSet, SchoolProgramViewSet, HeroSectionView
 
 router = DefaultRouter()
 router.register(r'venues', VenueViewSet)
@@ -21,9 +24,13 @@ router.register(r'contact-messages', ContactMessageViewSet, basename="contactmes
 urlpatterns = [
     path('', include(router.urls)),
     path("venues/<int:venue_id>/gallery/", VenueGalleryUploadView.as_view(), name="venue-gallery-upload"),
+    path("venues/<int:venue_id>/gallery/uploads/", GalleryUploadSessionView.as_view(), name="venue-gallery-upload-start"),
+    path("venues/<int:venue_id>/gallery/uploads/complete/", GalleryUploadCompleteView.as_view(), name="venue-gallery-upload-complete"),
+    path("venues/<int:venue_id>/gallery/uploads/<uuid:upload_id>/", GalleryUploadChunkView.as_view(), name="venue-gallery-upload-chunk"),
     path('about/', AboutDetailView.as_view(), name='about'),
     path('hero/', HeroSectionView.as_view(), name="hero-section"),
     path('footer-social-links/', FooterSocialLinkListView.as_view(), name='footer-social-links'),
     path('contact/', ContactFormView.as_view(), name='contact-form'),
+    path('bootstrap/', BootstrapView.as_view(), name='bootstrap'),
     
 ]
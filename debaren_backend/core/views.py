@@ -5,66 +5,108 @@ from rest_framework import status
 
 from rest_framework.generics import RetrieveAPIView
 
+from places.geo import NearbyMixin
 from places.models import SchoolProgram, Venue, WifiSpot
+from places.search import SearchIndexFilter
+from places.serializers import VenueSummarySerializer
+from .caching import CachedContentMixin
+from .pagination import RequiredCursorPagination
 from .models import  PopupVenue, About, FooterSocialLink, HeroSection
 from .serializers import PopupVenueSerializer, WifiSpotSerializer, SchoolProgramSerializer, AboutSerializer, FooterSocialLinkSerializer, HeroSectionSerializer
 
-
+DEFAULT_HERO = {
+    "title": "Discover Beautiful Venues Across South Africa",
+    "subtitle": "From schools to popup spaces and connected WiFi zones — debaren helps you find the perfect place.",
+    "cta_text": "Explore Venues",
+    "cta_url": "/venues"
+}
         
 
-class PopupVenueViewSet(viewsets.ModelViewSet):
+class PopupVenueViewSet(CachedContentMixin, viewsets.ModelViewSet):
     queryset = PopupVenue.objects.all()
     serializer_class = PopupVenueSerializer
+    pagination_class = RequiredCursorPagination
+    cache_name = "popup-venues"
+    cache_models = (PopupVenue,)
 
-class WifiSpotViewSet(viewsets.ModelViewSet):
+class WifiSpotViewSet(NearbyMixin, viewsets.ModelViewSet):
     queryset = WifiSpot.objects.all()
     serializer_class = WifiSpotSerializer
+    pagination_class = RequiredCursorPagination
+    filter_backends = [SearchIndexFilter]
 
 class SchoolProgramViewSet(viewsets.ModelViewSet):
     queryset = SchoolProgram.objects.all()
     serializer_class = SchoolProgramSerializer
+    pagination_class = RequiredCursorPagination
+    filter_backends = [SearchIndexFilter]
 
-class AboutDetailView(generics.RetrieveAPIView):
+class AboutDetailView(CachedContentMixin, generics.RetrieveAPIView):
     queryset = About.objects.all()
     serializer_class = AboutSerializer
+    cache_name = "about"
+    cache_models = (About,)
 
     def get_object(self):
         # Always return the latest About entry (or customize as needed)
         return About.objects.latest('updated_at')
 
-class FooterSocialLinkListView(generics.ListAPIView):
+class FooterSocialLinkListView(CachedContentMixin, generics.ListAPIView):
     queryset = FooterSocialLink.objects.all()
     serializer_class = FooterSocialLinkSerializer
+    cache_name = "footer-social-links"
+    cache_models = (FooterSocialLink,)
     
     
-class HeroSectionView(RetrieveAPIView):
+class HeroSectionView(CachedContentMixin, RetrieveAPIView):
     queryset = HeroSection.objects.all()
     serializer_class = HeroSectionSerializer
+    cache_name = "hero"
+    cache_models = (HeroSection,)
 
     def get_object(self):
-        qs = HeroSection.objects.all()
-        if qs.exists():
-            return qs.latest('updated_at')
-        # Optional: Return None here, or raise a custom error.
-        return None
+        # Latest hero in a single query; None when nothing has been set up yet.
+        return HeroSection.objects.order_by('-updated_at').first()
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(self.render_hero, request, *args, **kwargs)
+
+    def render_hero(self, request, *args, **kwargs):
+        instance = self.get_object()
+        if instance is None:
+            # Custom default
+            return Response(DEFAULT_HERO, status=status.HTTP_200_OK)
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+
+class BootstrapView(CachedContentMixin, generics.GenericAPIView):
+    """
+    Everything the homepage needs for first paint in one response. The
+    snapshot is cached and only rebuilt after one of its models changes.
+    """
+    cache_name = "bootstrap"
+    cache_models = (HeroSection, About, FooterSocialLink, PopupVenue, Venue, SchoolProgram)
+    featured_venue_count = 6
+    school_program_count = 6
 
     def get(self, request, *args, **kwargs):
-        try:
-            instance = self.get_object()
-            if instance is None:
-                # Custom default
-                return Response({
-                    "title": "Discover Beautiful Venues Across South Africa",
-                    "subtitle": "From schools to popup spaces and connected WiFi zones — debaren helps you find the perfect place.",
-                    "cta_text": "Explore Venues",
-                    "cta_url": "/venues"
-                }, status=status.HTTP_200_OK)
-            serializer = self.get_serializer(instance)
-            return Response(serializer.data)
-        except HeroSection.DoesNotExist:
-            return Response({
-                "title": "Discover Beautiful Venues Across South Africa",
-                "subtitle": "From schools to popup spaces and connected WiFi zones — debaren helps you find the perfect place.",
-                "cta_text": "Explore Venues",
-                "cta_url": "/venues"
-            }, status=status.HTTP_200_OK)
+        return self.retrieve(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(self.build_snapshot, request, *args, **kwargs)
+
+    def build_snapshot(self, request, *args, **kwargs):
+        context = self.get_serializer_context()
+        hero = HeroSection.objects.order_by('-updated_at').first()
+        about = About.objects.order_by('-updated_at').first()
+        featured = Venue.objects.filter(available=True).order_by('-rating', '-created_at')[:self.featured_venue_count]
+        programs = SchoolProgram.objects.order_by('-created_at')[:self.school_program_count]
+        return Response({
+            "hero": HeroSectionSerializer(hero, context=context).data if hero else DEFAULT_HERO,
+            "about": AboutSerializer(about, context=context).data if about else None,
+            "footer_social_links": FooterSocialLinkSerializer(FooterSocialLink.objects.all(), many=True, context=context).data,
+            "popup_venues": PopupVenueSerializer(PopupVenue.objects.all(), many=True, context=context).data,
+            "featured_venues": VenueSummarySerializer(featured, many=True, context=context).data,
+            "school_programs": SchoolProgramSerializer(programs, many=True, context=context).data,
+        })
@@ -22,6 +22,8 @@ ADMINS = [
 
 
 FRONTEND_URL = "https://debaren.vercel.app"
+# Absolute links in emails (e.g. signed resume downloads) point here.
+BACKEND_URL = os.environ.get("BACKEND_URL", "https://debaren.pythonanywhere.com")
 
 
 # Application definition
@@ -34,6 +36,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
+    'rest_framework.authtoken',
     'corsheaders',
     'core',
     'careers',
@@ -77,14 +80,14 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
-        "rest_framework.authentication.BasicAuthentication",
+        "accounts.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.DefaultCursorPagination",
 }
 ROOT_URLCONF = 'debaren_backend.urls'
 
@@ -117,6 +120,66 @@ DATABASES = {
 }
 
 
+# Caches
+# "content" holds the cached homepage API responses. The local-memory backend
+# evicts least-recently-used entries past MAX_ENTRIES but is per process; use
+# CONTENT_CACHE_BACKEND=file when several workers must share invalidations.
+
+CONTENT_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "debaren-content",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(BASE_DIR, "cache", "content"),
+    },
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "content": {
+        **CONTENT_CACHE_BACKENDS[os.environ.get("CONTENT_CACHE_BACKEND", "locmem")],
+        "TIMEOUT": int(os.environ.get("CONTENT_CACHE_TTL", 60 * 60)),
+        "OPTIONS": {"MAX_ENTRIES": 500},
+    },
+    # Shared by every worker when TOKEN_CACHE_URL points at Redis, so a revoked
+    # token is evicted everywhere at once.
+    "tokens": (
+        {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": os.environ["TOKEN_CACHE_URL"]}
+        if os.environ.get("TOKEN_CACHE_URL")
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "debaren-tokens"}
+    ),
+}
+
+
+# Token authentication
+# Tokens are resolved from a per-process LRU (TOKEN_LOCAL_CACHE_TTL seconds) and
+# then the TOKEN_CACHE_ALIAS cache. Revocation only reaches other workers through
+# a shared backend (TOKEN_CACHE_URL); while that cache is per-process its entries
+# are kept for TOKEN_LOCAL_CACHE_TTL seconds at most. TOKEN_EXPIRY (seconds)
+# makes login issue fresh tokens.
+
+TOKEN_EXPIRY = int(os.environ["TOKEN_EXPIRY"]) if os.environ.get("TOKEN_EXPIRY") else None
+TOKEN_CACHE_ALIAS = "tokens"
+TOKEN_LOCAL_CACHE_TTL = 5
+
+
+# Password hashing
+# Raising PASSWORD_PBKDF2_ITERATIONS re-hashes each password on its next login.
+
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get("PASSWORD_PBKDF2_ITERATIONS", 1_000_000))
+PASSWORD_HASHERS = [
+    "accounts.hashers.TunedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -156,12 +219,28 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Resumes and identity documents; never served by the /media/ route.
+PRIVATE_MEDIA_ROOT = BASE_DIR / 'private_media'
+# Their old upload_to prefixes: /media/ answers 404 for these even if a legacy copy is left in MEDIA_ROOT.
+PRIVATE_MEDIA_PREFIXES = ("resumes/", "user_files/")
+# Set to "nginx" (X-Accel-Redirect to MEDIA_ACCEL_PREFIX, an internal location aliased to
+# MEDIA_ROOT) or "sendfile" (X-Sendfile) to let the front server stream media files.
+MEDIA_ACCEL = os.environ.get("MEDIA_ACCEL", "")
+MEDIA_ACCEL_PREFIX = "/protected-media/"
+PRIVATE_MEDIA_ACCEL_PREFIX = "/protected-private-media/"
+
+# WebP thumbnail/medium/large copies of uploaded images are built off-request by this many threads.
+IMAGE_DERIVATIVE_WORKERS = int(os.environ.get("IMAGE_DERIVATIVE_WORKERS", 2))
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+EMAIL_BACKEND = "core.mail_backends.PooledSMTPEmailBackend"
+EMAIL_POOL_SIZE = 4
+EMAIL_POOL_MAX_IDLE = 60
+EMAIL_TIMEOUT = 30
 EMAIL_HOST = "ghanadude.com"
 EMAIL_PORT = 465
 EMAIL_USE_SSL = True
@@ -172,4 +251,8 @@ EMAIL_HOST_PASSWORD = "Maitland@2025"
 CONTACT_EMAIL = "info@ghanadude.com"
 DEFAULT_FROM_EMAIL = "info@ghanadude.com"
 SERVER_EMAIL = "info@ghanadude.com"
-HR_NOTIFICATION_EMAIL = SERVER_EMAIL
\ No newline at end of file
+HR_NOTIFICATION_EMAIL = SERVER_EMAIL
+# "link" (expiring signed download link) or "attach" for resumes in HR notifications.
+RESUME_DELIVERY = os.environ.get("RESUME_DELIVERY", "link")
+# clamd socket path or host:port; resumes are only format-checked when empty.
+CLAMAV_ADDRESS = os.environ.get("CLAMAV_ADDRESS", "")
\ No newline at end of file
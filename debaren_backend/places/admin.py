@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from core.softdelete import SoftDeleteAdminMixin
 from .models import Venue, VenueGalleryImage, WifiSpot, SchoolProgram, Booking
 
 
@@ -18,7 +19,7 @@ class VenueGalleryImageInline(admin.TabularInline):
 
 
 @admin.register(Venue)
-class VenueAdmin(admin.ModelAdmin):
+class VenueAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = (
         "name", "venue_type", "city", "region", "country",
         "capacity", "available", "created_at", "updated_at", "image_preview"
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, Exists, Max, OuterRef, Q
+
+from .models import Booking
+
+# Bookings in these states hold the venue; cancelled/rejected/completed do not.
+BLOCKING_STATUSES = ("pending", "confirmed")
+MAX_CALENDAR_DAYS = 366
+CACHE_TIMEOUT = 60 * 60
+
+
+def overlap_q(start, end):
+    """Bookings intersecting [start, end]; an open end_date means a single day."""
+    return Q(start_date__lte=end) & (
+        Q(end_date__gte=start) | Q(end_date__isnull=True, start_date__gte=start)
+    )
+
+
+def conflicting_bookings(venue_id, start, end, exclude_pk=None):
+    queryset = Booking.objects.filter(
+        overlap_q(start, end), venue_id=venue_id, status__in=BLOCKING_STATUSES,
+    )
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    return queryset
+
+
+def exclude_booked(queryset, start, end):
+    """Drop venues holding a blocking booking in [start, end] (a correlated NOT EXISTS)."""
+    busy = Booking.objects.filter(
+        overlap_q(start, end), venue=OuterRef("pk"), status__in=BLOCKING_STATUSES,
+    )
+    return queryset.filter(~Exists(busy))
+
+
+def booking_version(venue_id):
+    """
+    Fingerprint of a venue's bookings, read from the database so every worker
+    sees the same value: inserts and deletes change the count and every save
+    moves the latest ``updated_at``. One aggregate on the booking index.
+    """
+    stats = Booking.objects.filter(venue_id=venue_id).aggregate(count=Count("pk"), latest=Max("updated_at"))
+    latest = stats["latest"].timestamp() if stats["latest"] else 0
+    return f"{stats['count']}-{latest}"
+
+
+def booked_bitmap(venue_id, start, end):
+    """
+    Bitmap of booked days in [start, end]: bit ``i`` is set when
+    ``start + i days`` is taken. Built from one range query and cached under
+    the venue's ``booking_version``, so a booking change made by any worker
+    gives the next request a fresh bitmap.
+    """
+    version = booking_version(venue_id)
+    key = f"venue-availability:{venue_id}:{version}:{start.isoformat()}:{end.isoformat()}"
+    bitmap = cache.get(key)
+    if bitmap is not None:
+        return bitmap
+
+    bitmap = 0
+    rows = conflicting_bookings(venue_id, start, end).order_by().values_list("start_date", "end_date")
+    for booking_start, booking_end in rows:
+        first = max(booking_start, start)
+        last = min(booking_end or booking_start, end)
+        span = (last - first).days + 1
+        bitmap |= ((1 << span) - 1) << (first - start).days
+    cache.set(key, bitmap, CACHE_TIMEOUT)
+    return bitmap
+
+
+def calendar(venue_id, start, end):
+    bitmap = booked_bitmap(venue_id, start, end)
+    days = (end - start).days + 1
+    return [
+        {"date": start + timedelta(days=offset), "available": not (bitmap >> offset) & 1}
+        for offset in range(days)
+    ]
+
+
+def parse_range(params, default_days=30):
+    """Read ``from``/``to`` (ISO dates) from query params; raises ValueError."""
+    start = date.fromisoformat(params["from"]) if params.get("from") else date.today()
+    end = date.fromisoformat(params["to"]) if params.get("to") else start + timedelta(days=default_days)
+    if end < start:
+        raise ValueError("'to' must not be before 'from'.")
+    if (end - start).days + 1 > MAX_CALENDAR_DAYS:
+        raise ValueError(f"Range is limited to {MAX_CALENDAR_DAYS} days.")
+    return start, end
@@ -0,0 +1,121 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import CharField, Count, F, Value
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Venue, VenueTerm
+
+
+def _split(raw):
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+def _number(params, name, cast):
+    raw = params.get(name)
+    if raw in (None, ""):
+        return None
+    try:
+        return cast(raw)
+    except (ValueError, InvalidOperation):
+        raise ValidationError({name: "Must be a number."})
+
+
+def _boolean(params, name):
+    raw = params.get(name)
+    if raw in (None, ""):
+        return None
+    lowered = raw.lower()
+    if lowered in ("1", "true", "yes"):
+        return True
+    if lowered in ("0", "false", "no"):
+        return False
+    raise ValidationError({name: "Must be true or false."})
+
+
+def venues_with_terms(kind, values, match):
+    """Venue ids having any (or all) of ``values`` in the indexed term table."""
+    values = {value.lower() for value in values}
+    terms = VenueTerm.objects.filter(kind=kind, value__in=values)
+    if match == "all":
+        return (
+            terms.values("venue_id")
+            .annotate(matched=Count("value", distinct=True))
+            .filter(matched=len(values))
+            .values("venue_id")
+        )
+    return terms.values("venue_id")
+
+
+class VenueFilter(BaseFilterBackend):
+    """
+    Server-side venue filters:
+
+    ``venue_type``, ``city``, ``region`` (comma-separated for several values),
+    ``min_capacity``/``max_capacity``, ``min_price``/``max_price``, ``available``,
+    and ``amenities``/``tags`` with ``amenities_match``/``tags_match`` = any|all.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        for name in ("venue_type", "city", "region"):
+            values = _split(params.get(name, ""))
+            if values:
+                queryset = queryset.filter(**{f"{name}__in": values})
+
+        ranges = (
+            ("min_capacity", "capacity__gte", int),
+            ("max_capacity", "capacity__lte", int),
+            ("min_price", "price_per_day__gte", Decimal),
+            ("max_price", "price_per_day__lte", Decimal),
+        )
+        for param, lookup, cast in ranges:
+            value = _number(params, param, cast)
+            if value is not None:
+                queryset = queryset.filter(**{lookup: value})
+
+        available = _boolean(params, "available")
+        if available is not None:
+            queryset = queryset.filter(available=available)
+
+        for param, kind in (("amenities", VenueTerm.AMENITY), ("tags", VenueTerm.TAG)):
+            values = _split(params.get(param, ""))
+            if not values:
+                continue
+            match = params.get(f"{param}_match", "any")
+            if match not in ("any", "all"):
+                raise ValidationError({f"{param}_match": "Must be 'any' or 'all'."})
+            queryset = queryset.filter(pk__in=venues_with_terms(kind, values, match))
+
+        return queryset
+
+
+def venue_facets(queryset):
+    """
+    Counts per venue_type, city and amenity for ``queryset``, computed as one
+    UNION ALL of grouped aggregates.
+    """
+    venue_ids = queryset.order_by().values("pk")
+
+    def grouped(qs, facet, column):
+        return (
+            qs.order_by()
+            .annotate(facet=Value(facet, output_field=CharField()), bucket=F(column))
+            .values("facet", "bucket")
+            .annotate(count=Count("pk"))
+            .values_list("facet", "bucket", "count")
+        )
+
+    venues = Venue._base_manager.filter(pk__in=venue_ids)
+    amenities = VenueTerm.objects.filter(kind=VenueTerm.AMENITY, venue__in=venue_ids)
+    rows = grouped(venues, "venue_type", "venue_type").union(
+        grouped(venues, "city", "city"),
+        grouped(amenities, "amenity", "value"),
+        all=True,
+    )
+
+    facets = {"venue_type": {}, "city": {}, "amenity": {}}
+    for facet, bucket, count in rows:
+        facets[facet][bucket] = count
+    return facets
@@ -0,0 +1,230 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+from PIL import Image, UnidentifiedImageError
+
+from core.caching import invalidate_model
+from core.images import schedule_derivatives
+from core.storage import release
+from .models import GalleryUpload, Venue, VenueGalleryImage
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+MAX_FILE_SIZE = getattr(settings, "GALLERY_MAX_FILE_SIZE", 20 * 1024 * 1024)
+UPLOAD_EXPIRY = timedelta(hours=getattr(settings, "GALLERY_UPLOAD_EXPIRY_HOURS", 24))
+STAGING_DIR = Path(getattr(settings, "GALLERY_UPLOAD_STAGING_DIR", settings.BASE_DIR / "tmp" / "gallery_uploads"))
+# Per-user cap on resumable uploads that have not been completed yet.
+MAX_PENDING_UPLOADS = getattr(settings, "GALLERY_MAX_PENDING_UPLOADS", 20)
+MAX_PENDING_BYTES = getattr(settings, "GALLERY_MAX_PENDING_BYTES", 200 * 1024 * 1024)
+BLOCK_SIZE = 1024 * 1024
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "GALLERY_UPLOAD_WORKERS", 4),
+    thread_name_prefix="gallery-upload",
+)
+
+
+class GalleryUploadError(ValueError):
+    pass
+
+
+class UploadQuotaExceeded(GalleryUploadError):
+    pass
+
+
+class OffsetMismatch(GalleryUploadError):
+    def __init__(self, offset):
+        super().__init__(f"Upload is at offset {offset}.")
+        self.offset = offset
+
+
+def inspect_image(handle, size):
+    """Validate an uploaded image and return its sha256, reading it block by block."""
+    if size > MAX_FILE_SIZE:
+        raise GalleryUploadError(f"File is larger than {MAX_FILE_SIZE // (1024 * 1024)} MB.")
+    handle.seek(0)
+    try:
+        with Image.open(handle) as image:
+            image_format = image.format
+            image.verify()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+        raise GalleryUploadError("Upload a valid image.")
+    if image_format not in ALLOWED_FORMATS:
+        raise GalleryUploadError(f"{image_format} images are not supported.")
+
+    handle.seek(0)
+    digest = hashlib.sha256()
+    for block in iter(lambda: handle.read(BLOCK_SIZE), b""):
+        digest.update(block)
+    handle.seek(0)
+    return digest.hexdigest()
+
+
+def _inspect(upload):
+    try:
+        return inspect_image(upload, upload.size)
+    except GalleryUploadError as exc:
+        return exc
+
+
+def _store(upload):
+    field = VenueGalleryImage._meta.get_field("image")
+    # Temporary uploads are moved into place by FileSystemStorage rather than copied.
+    return field.storage.save(field.generate_filename(None, upload.name), upload)
+
+
+def add_gallery_images(venue, uploads, captions=None):
+    """
+    Add ``uploads`` (Django ``File`` objects) to ``venue``'s gallery.
+
+    Files are validated, hashed and written to storage on a thread pool, then
+    inserted with one ``bulk_create`` continuing the gallery's ``order``. A file
+    whose sha256 is already in the gallery is not stored again; its existing
+    row is returned in its place. Nothing is stored if any file is rejected:
+    ``GalleryUploadError`` then carries ``{file name: message}``.
+    """
+    uploads = list(uploads)
+    # Missing captions are blank; extra ones have no file to go with.
+    captions = (list(captions or []) + [""] * len(uploads))[:len(uploads)]
+    checksums = list(_executor.map(_inspect, uploads))
+    errors = {
+        upload.name: str(checksum)
+        for upload, checksum in zip(uploads, checksums)
+        if isinstance(checksum, GalleryUploadError)
+    }
+    if errors:
+        raise GalleryUploadError(errors)
+
+    known = set(VenueGalleryImage.objects.filter(venue=venue, checksum__in=checksums).values_list("checksum", flat=True))
+    fresh = {}
+    for upload, checksum, caption in zip(uploads, checksums, captions):
+        if checksum not in known and checksum not in fresh:
+            fresh[checksum] = (upload, caption)
+
+    names = dict(zip(fresh, _executor.map(_store, [upload for upload, _ in fresh.values()])))
+    try:
+        with transaction.atomic():
+            # Serialise concurrent uploads to one venue so their order values do not collide,
+            # and look the checksums up again under the lock in case one of them added a file.
+            Venue.objects.select_for_update().filter(pk=venue.pk).exists()
+            by_checksum = {
+                image.checksum: image
+                for image in VenueGalleryImage.objects.filter(venue=venue, checksum__in=checksums)
+            }
+            top = venue.gallery.aggregate(top=Max("order"))["top"]
+            start = 0 if top is None else top + 1
+            rows = [(checksum, caption) for checksum, (_, caption) in fresh.items() if checksum not in by_checksum]
+            created = VenueGalleryImage.objects.bulk_create([
+                VenueGalleryImage(venue=venue, image=names[checksum], caption=caption, checksum=checksum,
+                                  order=start + position)
+                for position, (checksum, caption) in enumerate(rows)
+            ])
+            by_checksum.update((image.checksum, image) for image in created)
+            for image in created:
+                schedule_derivatives(image.image.name, on_ready=lambda: invalidate_model(VenueGalleryImage))
+    except Exception:
+        # Blobs are shared, so only drop the ones no other row points at.
+        for name in names.values():
+            release(name)
+        raise
+
+    for checksum in fresh.keys() - {checksum for checksum, _ in rows}:
+        release(names[checksum])
+    return [by_checksum[checksum] for checksum in dict.fromkeys(checksums)]
+
+
+def staging_path(upload):
+    return STAGING_DIR / f"{upload.pk}.part"
+
+
+def received_bytes(upload):
+    try:
+        return staging_path(upload).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def start_upload(venue, owner, filename, size, caption=""):
+    """
+    Open a resumable upload for ``owner``. Raises ``UploadQuotaExceeded`` when
+    the owner already has too many uploads, or too many bytes, pending.
+    """
+    if size <= 0:
+        raise GalleryUploadError("Size must be a positive number of bytes.")
+    if size > MAX_FILE_SIZE:
+        raise GalleryUploadError(f"File is larger than {MAX_FILE_SIZE // (1024 * 1024)} MB.")
+    expire_uploads()
+    with transaction.atomic():
+        # Lock the owner's row so parallel requests cannot both slip under the quota.
+        type(owner).objects.select_for_update().filter(pk=owner.pk).exists()
+        pending = GalleryUpload.objects.filter(owner=owner).aggregate(count=Count("pk"), size=Sum("size"))
+        if pending["count"] >= MAX_PENDING_UPLOADS:
+            raise UploadQuotaExceeded(f"You already have {pending['count']} unfinished uploads.")
+        if (pending["size"] or 0) + size > MAX_PENDING_BYTES:
+            raise UploadQuotaExceeded(
+                f"Unfinished uploads may not exceed {MAX_PENDING_BYTES // (1024 * 1024)} MB in total."
+            )
+        return GalleryUpload.objects.create(venue=venue, owner=owner, filename=filename, size=size, caption=caption)
+
+
+def append_chunk(upload, offset, stream):
+    """
+    Append ``stream`` to the staging file of ``upload`` at ``offset`` and return
+    the new offset. Raises ``OffsetMismatch`` when ``offset`` is not where the
+    upload currently ends, so the client can resume from the right place.
+    """
+    path = staging_path(upload)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with transaction.atomic():
+        GalleryUpload.objects.select_for_update().filter(pk=upload.pk).exists()
+        with open(path, "ab") as handle:
+            if handle.tell() != offset:
+                raise OffsetMismatch(handle.tell())
+            remaining = upload.size - offset
+            for block in iter(lambda: stream.read(BLOCK_SIZE), b""):
+                if len(block) > remaining:
+                    handle.write(block[:remaining])
+                    raise GalleryUploadError("Chunk runs past the declared upload size.")
+                handle.write(block)
+                remaining -= len(block)
+            return handle.tell()
+
+
+def complete_uploads(venue, uploads):
+    """Move fully received resumable uploads into ``venue``'s gallery in one batch."""
+    incomplete = [str(upload.pk) for upload in uploads if received_bytes(upload) != upload.size]
+    if incomplete:
+        raise GalleryUploadError({upload_id: "Upload is incomplete." for upload_id in incomplete})
+
+    files = [File(open(staging_path(upload), "rb"), name=upload.filename) for upload in uploads]
+    try:
+        images = add_gallery_images(venue, files, [upload.caption for upload in uploads])
+    finally:
+        for handle in files:
+            handle.close()
+    discard_uploads(uploads)
+    return images
+
+
+def discard_uploads(uploads):
+    for upload in uploads:
+        staging_path(upload).unlink(missing_ok=True)
+    GalleryUpload.objects.filter(pk__in=[upload.pk for upload in uploads]).delete()
+
+
+def expire_uploads():
+    """Discard uploads older than ``UPLOAD_EXPIRY`` and return how many there were."""
+    expired = list(GalleryUpload.objects.filter(created_at__lt=timezone.now() - UPLOAD_EXPIRY))
+    if expired:
+        logger.info("Discarding %d abandoned gallery uploads", len(expired))
+        discard_uploads(expired)
+    return len(expired)
@@ -0,0 +1,137 @@
+import math
+
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 12
+EARTH_RADIUS_KM = 6371.0088
+
+
+def encode_geohash(lat, lng, precision=GEOHASH_PRECISION):
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def geohash_for(lat, lng):
+    if lat is None or lng is None:
+        return ""
+    return encode_geohash(float(lat), float(lng))
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bounding_box(lat, lng, radius_km):
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    d_lng = min(math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)), 180.0)
+    return (
+        max(lat - d_lat, -90.0), min(lat + d_lat, 90.0),
+        max(lng - d_lng, -180.0), min(lng + d_lng, 180.0),
+    )
+
+
+def covering_cells(min_lat, max_lat, min_lng, max_lng):
+    # Pick the finest precision whose cells are at least as large as the box,
+    # so the box touches at most 2x2 cells: the ones holding its corners.
+    precision = 1
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        lng_bits = (5 * p + 1) // 2
+        lat_bits = (5 * p) // 2
+        if 180.0 / 2 ** lat_bits >= max_lat - min_lat and 360.0 / 2 ** lng_bits >= max_lng - min_lng:
+            precision = p
+            break
+    return {
+        encode_geohash(lat, lng, precision)
+        for lat in (min_lat, max_lat)
+        for lng in (min_lng, max_lng)
+    }
+
+
+def nearby(queryset, lat, lng, radius_km, limit=None):
+    """
+    Return ``[(obj, distance_km), ...]`` within ``radius_km``, nearest first.
+
+    Candidates come from geohash prefix range scans on the indexed ``geohash``
+    column and are ranked on their coordinates alone; only the nearest
+    ``limit`` rows are then loaded through ``queryset`` with its joins and
+    prefetches.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    cell_filter = Q()
+    for cell in covering_cells(min_lat, max_lat, min_lng, max_lng):
+        cell_filter |= Q(geohash__gte=cell, geohash__lt=cell + "{")
+
+    candidates = (
+        queryset.filter(cell_filter).order_by()
+        .select_related(None).prefetch_related(None)
+        .only("pk", "latitude", "longitude")
+    )
+    ranked = []
+    for obj in candidates:
+        obj_lat, obj_lng = float(obj.latitude), float(obj.longitude)
+        if not (min_lat <= obj_lat <= max_lat and min_lng <= obj_lng <= max_lng):
+            continue
+        distance = haversine_km(lat, lng, obj_lat, obj_lng)
+        if distance <= radius_km:
+            ranked.append((obj.pk, distance))
+    ranked.sort(key=lambda pair: pair[1])
+    if limit:
+        ranked = ranked[:limit]
+
+    objects = queryset.order_by().in_bulk([pk for pk, _ in ranked])
+    return [(objects[pk], distance) for pk, distance in ranked if pk in objects]
+
+
+class NearbyMixin:
+    """Adds ``GET <list>/nearby/?lat=&lng=&radius_km=`` to a geo-enabled viewset."""
+    nearby_default_radius_km = 10
+    nearby_max_radius_km = 500
+    nearby_max_results = 100
+
+    @action(detail=False, methods=["get"], url_path="nearby")
+    def nearby(self, request):
+        try:
+            lat = float(request.query_params["lat"])
+            lng = float(request.query_params["lng"])
+            radius_km = float(request.query_params.get("radius_km", self.nearby_default_radius_km))
+        except (KeyError, ValueError):
+            return Response(
+                {"detail": "lat and lng are required numeric parameters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180) or not 0 < radius_km <= self.nearby_max_radius_km:
+            return Response(
+                {"detail": f"Coordinates out of range or radius_km not in (0, {self.nearby_max_radius_km}]."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        matches = nearby(self.get_queryset(), lat, lng, radius_km, self.nearby_max_results)
+        serializer = self.get_serializer([obj for obj, _ in matches], many=True)
+        data = serializer.data
+        for item, (_, distance) in zip(data, matches):
+            item["distance_km"] = round(distance, 3)
+        return Response(data)
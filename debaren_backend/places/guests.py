@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, connections, transaction
+
+from accounts.lookup import find_login_user
+from core.emails import render_email
+from core.mail_queue import enqueue_mail
+from .models import Booking
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "GUEST_ACCOUNT_WORKERS", 2),
+    thread_name_prefix="guest-account",
+)
+
+
+def guest_username(email):
+    """
+    ``email`` as the username, or when it is longer than the username column
+    its head plus a digest of the whole address so it stays unique.
+    """
+    max_length = User._meta.get_field("username").max_length
+    if len(email) <= max_length:
+        return email
+    digest = hashlib.sha256(email.lower().encode()).hexdigest()[:16]
+    return f"{email[:max_length - len(digest) - 1]}-{digest}"
+
+
+def guest_account(email):
+    """
+    The account for ``email``, creating it if needed. Returns ``(user,
+    password)``; ``password`` is ``None`` unless this call created the account.
+    """
+    user = find_login_user(email)
+    if user is not None:
+        return user, None
+
+    # Hash before touching the database so no transaction waits on PBKDF2.
+    password = secrets.token_urlsafe(9)
+    encoded = make_password(password)
+    try:
+        with transaction.atomic():
+            user = User.objects.create(username=guest_username(email), email=email, password=encoded)
+    except IntegrityError:
+        # Another booking from the same address created it first.
+        return find_login_user(email), None
+    return user, password
+
+
+def booking_email(booking, user, password):
+    context = {
+        "user": user,
+        "booking": booking,
+        "venue": booking.venue,
+        "change_pw_url": f"{settings.FRONTEND_URL}/account/reset-password/",
+    }
+    if password:
+        context["password"] = password
+        plain_message, html_message = render_email("emails/account_booking_created.html", context)
+        return "Your Debaren Booking & Account", plain_message, html_message
+    plain_message, html_message = render_email("emails/booking_confirmation.html", context)
+    return "Your Debaren Booking Confirmation", plain_message, html_message
+
+
+def provision_guest(booking_id):
+    """
+    Link the booking to the account for its email (creating one if needed) and
+    queue the account or confirmation email. Safe to run more than once: only
+    the run that links the booking sends anything.
+    """
+    booking = Booking.objects.select_related("venue").get(pk=booking_id)
+    if booking.user_id is not None:
+        return booking.user_id
+
+    user, password = guest_account(booking.customer_email)
+    with transaction.atomic():
+        if not Booking.objects.filter(pk=booking.pk, user__isnull=True).update(user=user):
+            return Booking.objects.values_list("user_id", flat=True).get(pk=booking.pk)
+        subject, plain_message, html_message = booking_email(booking, user, password)
+        enqueue_mail(subject, plain_message, [booking.customer_email], html_message=html_message)
+    booking.user = user
+    logger.info("Booking %s linked to %s account %s", booking.pk, "new" if password else "existing", user.pk)
+    return user.pk
+
+
+def _provision_safely(booking_id):
+    try:
+        provision_guest(booking_id)
+    except Exception:
+        logger.exception("Could not provision the guest account for booking %s", booking_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_guest_account(booking):
+    """Provision the guest account on the worker pool once the booking is committed."""
+    transaction.on_commit(lambda: _executor.submit(_provision_safely, booking.pk))
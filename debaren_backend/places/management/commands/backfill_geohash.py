@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from places.geo import geohash_for
+from places.models import Venue, WifiSpot
+
+
+class Command(BaseCommand):
+    help = "Populate the geohash column for venues and WiFi spots saved before it existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        for model in (Venue, WifiSpot):
+            pending = []
+            updated = 0
+            queryset = model.objects.filter(geohash="").exclude(latitude=None).exclude(longitude=None)
+            for obj in queryset.only("id", "latitude", "longitude").iterator(chunk_size=batch_size):
+                obj.geohash = geohash_for(obj.latitude, obj.longitude)
+                pending.append(obj)
+                if len(pending) >= batch_size:
+                    updated += model.objects.bulk_update(pending, ["geohash"])
+                    pending = []
+            if pending:
+                updated += model.objects.bulk_update(pending, ["geohash"])
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {updated} rows updated"))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from places.gallery import expire_uploads
+
+
+class Command(BaseCommand):
+    help = "Discard resumable gallery uploads that were started but never completed (run from cron)."
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS(f"{expire_uploads()} abandoned uploads discarded"))
@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from places.guests import provision_guest
+from places.models import Booking
+
+
+class Command(BaseCommand):
+    help = "Link recent bookings that have no account yet (e.g. after a restart) and send their emails."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=1,
+            help="Only bookings made in the last N days; older guests already got their emails.",
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options["days"])
+        pending = Booking.objects.filter(user__isnull=True, created_at__gte=since).values_list("pk", flat=True)
+        linked = 0
+        for pk in pending.iterator():
+            provision_guest(pk)
+            linked += 1
+        self.stdout.write(self.style.SUCCESS(f"{linked} bookings linked"))
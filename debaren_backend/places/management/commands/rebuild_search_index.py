@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from places.search import SEARCH_FIELDS, get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for venues, school programs and WiFi spots."
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        for model in SEARCH_FIELDS:
+            backend.rebuild(model)
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: index rebuilt"))
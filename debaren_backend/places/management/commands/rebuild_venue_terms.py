@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from places.models import Venue, VenueTerm
+
+
+class Command(BaseCommand):
+    help = "Rebuild the indexed amenity/tag table used by the venue filters and facets."
+
+    def handle(self, *args, **options):
+        count = 0
+        for venue in Venue.objects.only("id", "amenities", "tags").iterator():
+            VenueTerm.sync(venue)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"{count} venues synced"))
@@ -0,0 +1,192 @@
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework.filters import BaseFilterBackend
+
+from .models import SchoolProgram, Venue, WifiSpot
+
+# Indexed columns per model, with their relative weight in the ranking.
+SEARCH_FIELDS = {
+    Venue: {"name": 10.0, "description": 1.0, "tags": 5.0, "amenities": 3.0},
+    SchoolProgram: {"name": 10.0, "description": 1.0},
+    WifiSpot: {"name": 10.0, "description": 1.0},
+}
+
+# Shorter terms only match whole tokens in the SQLite index.
+MIN_PREFIX_LENGTH = 3
+
+
+def document_for(obj):
+    values = {}
+    for name in SEARCH_FIELDS[type(obj)]:
+        value = getattr(obj, name) or ""
+        if isinstance(value, (list, tuple)):
+            value = " ".join(str(item) for item in value)
+        values[name] = str(value)
+    return values
+
+
+def query_terms(query):
+    return re.findall(r"\w+", query.lower())
+
+
+class SearchBackend:
+    """Interface for the inverted index behind ``?q=`` search."""
+
+    def setup(self, model):
+        pass
+
+    def index(self, obj):
+        pass
+
+    def remove(self, model, pk):
+        pass
+
+    def rebuild(self, model):
+        self.setup(model)
+        for obj in model._default_manager.iterator():
+            self.index(obj)
+
+    def search(self, queryset, query):
+        """
+        ``queryset`` narrowed to rows matching ``query`` and annotated with
+        ``search_rank`` (lower is better), all in SQL so later filters and
+        pagination see every hit.
+        """
+        raise NotImplementedError
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """One external FTS5 table per model, keyed by the row's primary key."""
+
+    def table(self, model):
+        return f"{model._meta.db_table}_fts"
+
+    def setup(self, model):
+        columns = ", ".join(SEARCH_FIELDS[model])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table(model)} "
+                f"USING fts5({columns}, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    def index(self, obj):
+        model = type(obj)
+        document = document_for(obj)
+        columns = ", ".join(document)
+        placeholders = ", ".join(["%s"] * len(document))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table(model)} WHERE rowid = %s", [obj.pk])
+            cursor.execute(
+                f"INSERT INTO {self.table(model)} (rowid, {columns}) VALUES (%s, {placeholders})",
+                [obj.pk, *document.values()],
+            )
+
+    def remove(self, model, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table(model)} WHERE rowid = %s", [pk])
+
+    def rebuild(self, model):
+        self.setup(model)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table(model)}")
+        super().rebuild(model)
+
+    def search(self, queryset, query):
+        terms = query_terms(query)
+        if not terms:
+            return queryset.none()
+        # Every term must match; each one is quoted so user input can never be
+        # parsed as FTS5 syntax. Only terms of MIN_PREFIX_LENGTH or more are
+        # prefix-matched: "a"* expands to a large share of the vocabulary.
+        match = " ".join(f'"{term}"*' if len(term) >= MIN_PREFIX_LENGTH else f'"{term}"' for term in terms)
+        model = queryset.model
+        weights = ", ".join(str(weight) for weight in SEARCH_FIELDS[model].values())
+        table = self.table(model)
+        # Join the index so the full-text query runs once. A correlated
+        # "MATCH ... AND rowid = pk" subquery re-runs it for every hit, which
+        # is quadratic in the number of hits for common terms. The pk side of
+        # the join is an ORM filter so it follows the alias the queryset gets
+        # when it is nested in another query.
+        return (
+            queryset.extra(tables=[table], where=[f"{table} MATCH %s"], params=[match])
+            .filter(pk=RawSQL(f"{table}.rowid", []))
+            .annotate(search_rank=RawSQL(f"bm25({table}, {weights})", [], output_field=FloatField()))
+            .order_by("search_rank", "pk")
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Ranks with ``tsvector``/``ts_rank`` computed from the model columns, so no
+    side table needs to be kept in sync. Back it with a GIN expression index
+    in production.
+    """
+    weight_labels = ("A", "B", "C", "D")
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+        from django.db.models import TextField
+        from django.db.models.functions import Cast
+
+        fields = sorted(SEARCH_FIELDS[queryset.model].items(), key=lambda item: -item[1])
+        vector = None
+        for position, (name, _) in enumerate(fields):
+            label = self.weight_labels[min(position, len(self.weight_labels) - 1)]
+            part = SearchVector(Cast(name, TextField()), weight=label)
+            vector = part if vector is None else vector + part
+        search_query = SearchQuery(query, search_type="websearch")
+        return (
+            queryset.annotate(search_score=SearchRank(vector, search_query))
+            .filter(search_score__gt=0)
+            .annotate(search_rank=-F("search_score"))
+            .order_by("search_rank", "pk")
+        )
+
+
+class BasicSearchBackend(SearchBackend):
+    """Fallback for databases without a full-text engine: icontains on every term."""
+
+    def search(self, queryset, query):
+        terms = query_terms(query)
+        if not terms:
+            return queryset.none()
+        condition = Q()
+        for term in terms:
+            term_q = Q()
+            for name in SEARCH_FIELDS[queryset.model]:
+                term_q |= Q(**{f"{name}__icontains": term})
+            condition &= term_q
+        # No relevance score here: newest rows first.
+        return queryset.filter(condition).annotate(search_rank=-F("pk")).order_by("search_rank")
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    path = getattr(settings, "SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+    if connection.vendor == "sqlite":
+        return SQLiteFTS5Backend()
+    if connection.vendor == "postgresql":
+        return PostgresSearchBackend()
+    return BasicSearchBackend()
+
+
+class SearchIndexFilter(BaseFilterBackend):
+    """
+    ``?q=`` full-text filter. Results are annotated with ``search_rank`` and
+    ordered by it, best match first.
+    """
+    search_param = "q"
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+        return get_search_backend().search(queryset, query)
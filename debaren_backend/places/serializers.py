@@ -1,9 +1,14 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import Booking
 import json
 import re
 from rest_framework import serializers
-from .models import Venue, VenueGalleryImage
+from core.images import ImageDerivativesField
+from core.mixins import SparseFieldsetMixin
+from .models import GalleryUpload, Venue, VenueGalleryImage
+from .availability import conflicting_bookings
+from .gallery import GalleryUploadError, add_gallery_images, received_bytes
 
 class AmenityField(serializers.JSONField):
     def to_internal_value(self, data):
@@ -23,22 +28,47 @@ class AmenityField(serializers.JSONField):
 
 
 class VenueGalleryImageSerializer(serializers.ModelSerializer):
+    image_variants = ImageDerivativesField()
+
     class Meta:
         model = VenueGalleryImage
-        fields = ['id', 'image', 'caption', 'order']
+        fields = ['id', 'image', 'image_variants', 'caption', 'order']
+
+
+class GalleryUploadSerializer(serializers.ModelSerializer):
+    offset = serializers.SerializerMethodField()
+
+    class Meta:
+        model = GalleryUpload
+        fields = ["id", "filename", "size", "caption", "offset", "created_at"]
+        read_only_fields = ["id", "created_at"]
+
+    def get_offset(self, obj):
+        return received_bytes(obj)
+
+    def validate_size(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("Size must be a positive number of bytes.")
+        return value
+
+
+class GalleryUploadCompleteSerializer(serializers.Serializer):
+    uploads = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
 
-class VenueSerializer(serializers.ModelSerializer):
+class VenueSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     gallery = VenueGalleryImageSerializer(many=True, read_only=True)
     gallery_upload = serializers.ListField(
         child=serializers.ImageField(max_length=1000000, allow_empty_file=False, use_url=False),
         write_only=True, required=False,
     )
     amenities = AmenityField()  # <-- custom field here!
+    image_variants = ImageDerivativesField()
 
     class Meta:
         model = Venue
         fields = [
-            "id", "name", "venue_type", "description", "image", "gallery", "gallery_upload",
+            "id", "name", "venue_type", "description", "image", "image_variants", "gallery", "gallery_upload",
             "address", "city", "region", "country", "postal_code", "latitude", "longitude",
             "capacity", "amenities", "price_per_day", "contact_email", "contact_phone",
             "website", "available", "rating", "tags", "created_at", "updated_at"
@@ -81,20 +111,40 @@ class VenueSerializer(serializers.ModelSerializer):
 
         return ret
 
+    def add_gallery(self, venue, gallery_files):
+        if not gallery_files:
+            return
+        try:
+            add_gallery_images(venue, gallery_files)
+        except GalleryUploadError as e:
+            raise serializers.ValidationError({"gallery_upload": e.args[0]})
+
     def create(self, validated_data):
         gallery_files = validated_data.pop("gallery_upload", [])
         venue = super().create(validated_data)
-        for img in gallery_files:
-            VenueGalleryImage.objects.create(venue=venue, image=img)
+        self.add_gallery(venue, gallery_files)
         return venue
 
     def update(self, instance, validated_data):
         gallery_files = validated_data.pop("gallery_upload", [])
         venue = super().update(instance, validated_data)
-        for img in gallery_files:
-            VenueGalleryImage.objects.create(venue=venue, image=img)
+        self.add_gallery(venue, gallery_files)
         return venue
 
+class VenueSummarySerializer(VenueSerializer):
+    """Card-sized venue for listings: no description, amenities or gallery."""
+    gallery = None
+    gallery_upload = None
+    amenities = None
+
+    class Meta(VenueSerializer.Meta):
+        fields = [
+            "id", "name", "venue_type", "image", "image_variants", "city", "region", "country",
+            "capacity", "price_per_day", "available", "rating", "tags",
+        ]
+        read_only_fields = fields
+
+
 class BookingSerializer(serializers.ModelSerializer):
     class Meta:
         model = Booking
@@ -105,6 +155,25 @@ class BookingSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "status")
 
     def validate(self, data):
-        if data["end_date"] and data["start_date"] and data["end_date"] < data["start_date"]:
+        start_date = data.get("start_date", getattr(self.instance, "start_date", None))
+        end_date = data.get("end_date", getattr(self.instance, "end_date", None))
+        if end_date and start_date and end_date < start_date:
             raise serializers.ValidationError("End date must be after start date.")
+        venue = data.get("venue", getattr(self.instance, "venue", None))
+        if venue and start_date:
+            self.check_availability(venue, start_date, end_date or start_date)
         return data
+
+    def check_availability(self, venue, start_date, end_date):
+        exclude_pk = self.instance.pk if self.instance else None
+        if conflicting_bookings(venue.pk, start_date, end_date, exclude_pk).exists():
+            raise serializers.ValidationError("The venue is already booked for the selected dates.")
+
+    def create(self, validated_data):
+        # Re-check under a lock on the venue row so two concurrent requests
+        # for the same dates cannot both pass validation.
+        with transaction.atomic():
+            venue = Venue.objects.select_for_update().get(pk=validated_data["venue"].pk)
+            start_date = validated_data["start_date"]
+            self.check_availability(venue, start_date, validated_data.get("end_date") or start_date)
+            return super().create(validated_data)
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .models import Venue, VenueTerm
+from .search import SEARCH_FIELDS, get_search_backend
+
+
+def sync_search_index(sender, instance, **kwargs):
+    if getattr(instance, "is_deleted", False):
+        get_search_backend().remove(sender, instance.pk)
+    else:
+        get_search_backend().index(instance)
+
+
+def drop_from_search_index(sender, instance, **kwargs):
+    get_search_backend().remove(sender, instance.pk)
+
+
+for _model in SEARCH_FIELDS:
+    post_save.connect(sync_search_index, sender=_model, dispatch_uid=f"search-save-{_model.__name__}")
+    post_delete.connect(drop_from_search_index, sender=_model, dispatch_uid=f"search-delete-{_model.__name__}")
+
+
+@receiver(post_save, sender=Venue, dispatch_uid="venue-terms-sync")
+def sync_venue_terms(sender, instance, **kwargs):
+    VenueTerm.sync(instance)
+
+
+@receiver(post_migrate)
+def create_search_index(sender, **kwargs):
+    if sender.name != "places":
+        return
+    backend = get_search_backend()
+    for model in SEARCH_FIELDS:
+        backend.setup(model)
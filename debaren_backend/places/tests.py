@@ -1,3 +1,219 @@
+import io
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from PIL import Image
+from rest_framework.test import APIClient
+
+from core.testing import ListQueryCountMixin
+
+from . import gallery, guests
+from .models import Booking, GalleryUpload, SchoolProgram, Venue, VenueGalleryImage
+
+
+class ListQueryCountTests(ListQueryCountMixin, TestCase):
+    def add_venues(self, count):
+        venues = Venue.objects.bulk_create(
+            [Venue(name=f"Venue {i}", venue_type="hall", address="Main road") for i in range(count)]
+        )
+        VenueGalleryImage.objects.bulk_create(
+            [VenueGalleryImage(venue=venue, image=f"venues/gallery/{venue.pk}-{n}.jpg", order=n)
+             for venue in venues for n in range(2)]
+        )
+        return venues
+
+    def test_venue_list(self):
+        # venues + prefetched gallery
+        self.assertListQueries("/api/venues/", 2, self.add_venues)
+
+    def test_venue_list_paginated(self):
+        self.assertListQueries("/api/venues/?page_size=50", 2, self.add_venues)
+
+    def test_school_program_list(self):
+        def add_programs(count):
+            SchoolProgram.objects.bulk_create([SchoolProgram(name=f"Program {i}") for i in range(count)])
+
+        self.assertListQueries("/api/school-programs/", 1, add_programs)
+
+    def test_booking_list(self):
+        def add_bookings(count):
+            venue = self.add_venues(1)[0]
+            Booking.objects.bulk_create([
+                Booking(venue=venue, customer_name=f"Guest {i}", customer_email=f"guest{i}@example.com",
+                        start_date=date(2030, 1, 1) + timedelta(days=i))
+                for i in range(count)
+            ])
+
+        self.assertListQueries("/api/bookings/", 1, add_bookings)
+
+
+def png(name, color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class GalleryUploadTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.venue = Venue.objects.create(name="Hall", venue_type="hall", address="Main road")
+        self.user = User.objects.create_user("uploader", "uploader@example.com", "pw")
+
+    def test_fewer_captions_than_files(self):
+        files = [png(f"{n}.png", (n * 40, 0, 0)) for n in range(3)]
+        response = self.client.post(
+            f"/api/venues/{self.venue.pk}/gallery/", {"gallery": files, "caption": ["First"]}, format="multipart"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            list(self.venue.gallery.order_by("order").values_list("caption", "order")),
+            [("First", 0), ("", 1), ("", 2)],
+        )
+
+    def test_resumable_uploads_require_login(self):
+        url = f"/api/venues/{self.venue.pk}/gallery/uploads/"
+        response = self.client.post(url, {"filename": "a.png", "size": 10}, format="json")
+        self.assertIn(response.status_code, (401, 403))
+        self.assertFalse(GalleryUpload.objects.exists())
+
+    def test_uploads_belong_to_their_owner(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(
+            f"/api/venues/{self.venue.pk}/gallery/uploads/", {"filename": "a.png", "size": 10}, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.client.force_authenticate(User.objects.create_user("other", "other@example.com", "pw"))
+        response = self.client.get(f"/api/venues/{self.venue.pk}/gallery/uploads/{response.data['id']}/")
+        self.assertEqual(response.status_code, 404)
+
+    @mock.patch.multiple(gallery, MAX_PENDING_UPLOADS=2, MAX_PENDING_BYTES=100)
+    def test_pending_upload_quota(self):
+        self.client.force_authenticate(self.user)
+        url = f"/api/venues/{self.venue.pk}/gallery/uploads/"
+        self.assertEqual(self.client.post(url, {"filename": "a.png", "size": 60}, format="json").status_code, 201)
+        self.assertEqual(self.client.post(url, {"filename": "b.png", "size": 60}, format="json").status_code, 429)
+        self.assertEqual(self.client.post(url, {"filename": "c.png", "size": 40}, format="json").status_code, 201)
+        self.assertEqual(self.client.post(url, {"filename": "d.png", "size": 1}, format="json").status_code, 429)
+
+    def test_expire_uploads(self):
+        upload = gallery.start_upload(self.venue, self.user, "a.png", 10)
+        GalleryUpload.objects.filter(pk=upload.pk).update(created_at=upload.created_at - gallery.UPLOAD_EXPIRY)
+        self.assertEqual(gallery.expire_uploads(), 1)
+        self.assertFalse(GalleryUpload.objects.exists())
+
+
+class AvailabilityTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.venue = Venue.objects.create(name="Hall", venue_type="hall", address="Main road")
+        caches["default"].clear()
+
+    def book(self, start, end=None, status="confirmed"):
+        return Booking.objects.create(
+            venue=self.venue, customer_name="Guest", customer_email="guest@example.com",
+            start_date=start, end_date=end, status=status,
+        )
+
+    def booked_days(self):
+        response = self.client.get(
+            f"/api/venues/{self.venue.pk}/availability/", {"from": "2030-01-01", "to": "2030-01-10"}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [day["date"].day for day in response.data["days"] if not day["available"]]
+
+    def test_calendar_marks_blocking_bookings(self):
+        self.book(date(2030, 1, 2), date(2030, 1, 4))
+        self.book(date(2030, 1, 8))
+        self.book(date(2030, 1, 6), status="cancelled")
+        self.assertEqual(self.booked_days(), [2, 3, 4, 8])
+
+    def test_create_rejects_overlap(self):
+        self.book(date(2030, 1, 2), date(2030, 1, 4))
+        data = {"venue": self.venue.pk, "customer_name": "Other", "customer_email": "other@example.com"}
+        for start, end, expected in [
+            ("2030-01-04", "2030-01-06", 400),  # shares the last day
+            ("2029-12-30", "2030-01-10", 400),  # covers it
+            ("2030-01-03", "", 400),  # single day inside
+            ("2030-01-05", "2030-01-06", 201),
+        ]:
+            with self.subTest(start=start, end=end):
+                response = self.client.post("/api/bookings/", {**data, "start_date": start, "end_date": end or None},
+                                            format="json")
+                self.assertEqual(response.status_code, expected)
+
+    def test_cached_calendar_sees_changes_from_any_writer(self):
+        booking = self.book(date(2030, 1, 2))
+        self.assertEqual(self.booked_days(), [2])
+        # Queryset writes fire no signals, like a change made by another worker would not here.
+        Booking.objects.bulk_create([Booking(venue=self.venue, customer_name="Guest", customer_email="g@example.com",
+                                             start_date=date(2030, 1, 5), status="pending")])
+        self.assertEqual(self.booked_days(), [2, 5])
+        booking.status = "cancelled"
+        booking.save()
+        self.assertEqual(self.booked_days(), [5])
+        Booking.objects.filter(start_date=date(2030, 1, 5)).delete()
+        self.assertEqual(self.booked_days(), [])
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        caches["content"].clear()
+
+    def venue(self, name, description=""):
+        return Venue.objects.create(name=name, venue_type="hall", address="Main road", description=description)
+
+    def search(self, query, **params):
+        response = self.client.get("/api/venues/", {"q": query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_ranks_name_hits_first_and_needs_every_term(self):
+        described = self.venue("Beach house", "A garden by the sea")
+        named = self.venue("Garden hall")
+        self.venue("Garden lodge", "Up in the hills")
+        self.venue("Rooftop")
+        ids = [venue["id"] for venue in self.search("garden")["results"]]
+        self.assertEqual(ids[0], named.pk)
+        self.assertEqual(len(ids), 3)
+        self.assertEqual([venue["id"] for venue in self.search("sea garden")["results"]], [described.pk])
+
+    def test_only_longer_terms_match_as_prefixes(self):
+        self.venue("Garden hall")
+        self.venue("GA offices")
+        self.assertEqual([venue["name"] for venue in self.search("gar")["results"]], ["Garden hall"])
+        self.assertEqual([venue["name"] for venue in self.search("ga")["results"]], ["GA offices"])
+
+    def test_pages_through_every_hit(self):
+        expected = {self.venue(f"Garden {n}", "garden " * n).pk for n in range(1, 6)}
+        page = self.search("garden", page_size=2)
+        seen = [venue["id"] for venue in page["results"]]
+        while page["next"]:
+            page = self.client.get(page["next"]).data
+            seen += [venue["id"] for venue in page["results"]]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(set(seen), expected)
+
+    def test_facets_of_a_search(self):
+        # The search queryset is nested as a subquery here.
+        self.venue("Garden hall")
+        self.venue("Rooftop")
+        response = self.client.get("/api/venues/facets/", {"q": "garden"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["venue_type"], {"hall": 1})
+
 
-# Create your tests here.
+class GuestAccountTests(TestCase):
+    def test_long_email_fits_the_username_column(self):
+        venue = Venue.objects.create(name="Hall", venue_type="hall", address="Main road")
+        email = f"{'a' * 200}@example.com"
+        booking = Booking.objects.create(venue=venue, customer_name="Guest", customer_email=email,
+                                         start_date=date(2030, 1, 1))
+        user = User.objects.get(pk=guests.provision_guest(booking.pk))
+        self.assertEqual(user.email, email)
+        self.assertLessEqual(len(user.username), 150)
+        self.assertEqual(guests.provision_guest(booking.pk), user.pk)
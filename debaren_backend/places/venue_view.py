@@ -1,12 +1,21 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from core.mixins import QueryPlanningMixin
+from core.pagination import RequiredCursorPagination
+from django.shortcuts import get_object_or_404
+from .availability import calendar, exclude_booked, parse_range
+from .filters import VenueFilter, venue_facets
+from .geo import NearbyMixin
 from .models import Venue, VenueGalleryImage
+from .search import SearchIndexFilter
 from .serializers import VenueSerializer
 
-class VenueViewSet(viewsets.ModelViewSet):
+class VenueViewSet(QueryPlanningMixin, NearbyMixin, viewsets.ModelViewSet):
     queryset = Venue.objects.all()
     serializer_class = VenueSerializer
+    pagination_class = RequiredCursorPagination
+    filter_backends = [SearchIndexFilter, VenueFilter]
 
     def create(self, request, *args, **kwargs):
         print("\n[VenueViewSet] Incoming POST data:", request.data)
@@ -39,3 +48,37 @@ class VenueViewSet(viewsets.ModelViewSet):
         except VenueGalleryImage.DoesNotExist:
             print(f"[VenueViewSet] Image {image_id} not found for venue {venue.id}")
             return Response({"detail": "Not found"}, status=404)
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        queryset = self.filter_queryset(Venue.objects.all())
+        return Response(venue_facets(queryset))
+
+    @action(detail=True, methods=["get"])
+    def availability(self, request, pk=None):
+        venue = get_object_or_404(Venue.objects.only("id"), pk=pk)
+        try:
+            start, end = parse_range(request.query_params)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            "venue": venue.pk,
+            "from": start,
+            "to": end,
+            "days": calendar(venue.pk, start, end),
+        })
+
+    @action(detail=False, methods=["get"])
+    def available(self, request):
+        """Venues matching the list filters that are free for the whole ?from=&to= range."""
+        try:
+            start, end = parse_range(request.query_params, default_days=0)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        queryset = self.filter_queryset(self.get_queryset()).filter(available=True)
+        queryset = exclude_booked(queryset, start, end)
+
+        paginator = RequiredCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
@@ -1,18 +1,14 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
+from core.pagination import RequiredCursorPagination
 from .models import Booking, Venue
 from .serializers import BookingSerializer
-from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.conf import settings
-from django.utils.html import strip_tags
-
-User = get_user_model()
+from .guests import schedule_guest_account
 
 class BookingViewSet(viewsets.ModelViewSet):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
+    pagination_class = RequiredCursorPagination
     permission_classes = [permissions.AllowAny]
 
     def create(self, request, *args, **kwargs):
@@ -31,63 +27,8 @@ class BookingViewSet(viewsets.ModelViewSet):
             print("Exception during booking save:", e)
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        email = booking.customer_email
-        username = email
-        password = f"{username}@Debaren2025"
-
-        # 1. User creation if not exists
-        user, created = User.objects.get_or_create(email=email, defaults={"username": username})
-        print(f"User {'created' if created else 'already exists'}: {user}")
-
-        if created:
-            user.set_password(password)
-            user.save()
-            print("User password set and saved.")
-
-            # 2. Send the styled account/booking email
-            context = {
-                "user": user,
-                "password": password,
-                "booking": booking,
-                "venue": booking.venue,
-                "change_pw_url": f"{settings.FRONTEND_URL}/account/reset-password/"
-            }
-            subject = f"Your Debaren Booking & Account"
-            html_message = render_to_string("emails/account_booking_created.html", context)
-            plain_message = strip_tags(html_message)
-            try:
-                send_mail(
-                    subject,
-                    plain_message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [email],
-                    html_message=html_message
-                )
-                print("Account creation & booking email sent to:", email)
-            except Exception as email_exc:
-                print("Exception during sending account/booking email:", email_exc)
-        else:
-            # Existing user: Just send booking confirmation
-            context = {
-                "user": user,
-                "booking": booking,
-                "venue": booking.venue,
-                "change_pw_url": f"{settings.FRONTEND_URL}/account/reset-password/"
-            }
-            subject = f"Your Debaren Booking Confirmation"
-            html_message = render_to_string("emails/booking_confirmation.html", context)
-            plain_message = strip_tags(html_message)
-            try:
-                send_mail(
-                    subject,
-                    plain_message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [email],
-                    html_message=html_message
-                )
-                print("Booking confirmation email sent to:", email)
-            except Exception as email_exc:
-                print("Exception during sending booking confirmation email:", email_exc)
+        # Account creation, its password hash and the emails run on a worker.
+        schedule_guest_account(booking)
 
         print("All steps done, returning API response.\n")
         headers = self.get_success_headers(serializer.data)
@@ -97,24 +38,105 @@ class BookingViewSet(viewsets.ModelViewSet):
 
 # views.py
 
+import io
+
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework import status, permissions
-from .models import Venue, VenueGalleryImage
-from .serializers import VenueGalleryImageSerializer
+from .gallery import (
+    GalleryUploadError, OffsetMismatch, UploadQuotaExceeded, add_gallery_images, append_chunk, complete_uploads,
+    discard_uploads, start_upload,
+)
+from .models import GalleryUpload, Venue
+from .serializers import GalleryUploadCompleteSerializer, GalleryUploadSerializer, VenueGalleryImageSerializer
 
 class VenueGalleryUploadView(APIView):
     parser_classes = [MultiPartParser, FormParser]
     permission_classes = [permissions.AllowAny]
     
     def post(self, request, venue_id):
-        venue = Venue.objects.get(pk=venue_id)
+        venue = get_object_or_404(Venue, pk=venue_id)
+        # Spool every file to disk as it streams in instead of holding small ones in memory.
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
         images = request.FILES.getlist("gallery")
-        gallery_images = []
-        for img in images:
-            gallery_image = VenueGalleryImage.objects.create(venue=venue, image=img)
-            gallery_images.append(gallery_image)
-        serializer = VenueGalleryImageSerializer(gallery_images, many=True)
+        if not images:
+            return Response({"gallery": ["No files were submitted."]}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            gallery_images = add_gallery_images(venue, images, request.data.getlist("caption") or None)
+        except GalleryUploadError as e:
+            return Response({"gallery": e.args[0]}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = VenueGalleryImageSerializer(gallery_images, many=True, context={"request": request})
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+
+class GalleryUploadSessionView(APIView):
+    """Start a resumable upload; chunks then go to ``GalleryUploadChunkView``."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, venue_id):
+        venue = get_object_or_404(Venue, pk=venue_id)
+        serializer = GalleryUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = start_upload(venue, request.user, **serializer.validated_data)
+        except UploadQuotaExceeded as e:
+            return Response({"detail": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+        except GalleryUploadError as e:
+            return Response({"size": [str(e)]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(GalleryUploadSerializer(upload).data, status=status.HTTP_201_CREATED)
+
+
+class GalleryUploadChunkView(APIView):
+    """
+    GET reports how many bytes have arrived, PATCH appends the raw request body
+    at the ``Upload-Offset`` header and DELETE abandons the upload. Only the
+    user who started an upload can see or change it.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_upload(self, request, venue_id, upload_id):
+        return get_object_or_404(GalleryUpload, pk=upload_id, venue_id=venue_id, owner=request.user)
+
+    def get(self, request, venue_id, upload_id):
+        return Response(GalleryUploadSerializer(self.get_upload(request, venue_id, upload_id)).data)
+
+    def patch(self, request, venue_id, upload_id):
+        upload = self.get_upload(request, venue_id, upload_id)
+        try:
+            offset = int(request.headers["Upload-Offset"])
+        except (KeyError, ValueError):
+            return Response({"detail": "Upload-Offset header is required."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            offset = append_chunk(upload, offset, request.stream or io.BytesIO())
+        except OffsetMismatch as e:
+            return Response({"detail": str(e), "offset": e.offset}, status=status.HTTP_409_CONFLICT)
+        except GalleryUploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"id": str(upload.pk), "offset": offset, "size": upload.size})
+
+    def delete(self, request, venue_id, upload_id):
+        discard_uploads([self.get_upload(request, venue_id, upload_id)])
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class GalleryUploadCompleteView(APIView):
+    """Add a batch of fully received resumable uploads to the gallery at once."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, venue_id):
+        venue = get_object_or_404(Venue, pk=venue_id)
+        body = GalleryUploadCompleteSerializer(data=request.data)
+        body.is_valid(raise_exception=True)
+        upload_ids = set(body.validated_data["uploads"])
+        uploads = list(GalleryUpload.objects.filter(venue=venue, owner=request.user, pk__in=upload_ids))
+        if len(uploads) != len(upload_ids):
+            return Response({"uploads": ["Unknown upload id."]}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            gallery_images = complete_uploads(venue, uploads)
+        except GalleryUploadError as e:
+            return Response({"uploads": e.args[0]}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = VenueGalleryImageSerializer(gallery_images, many=True, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_201_CREATED)